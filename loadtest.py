@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+import argparse
+
+from src.loadtest import LoadHarness, StubSettings
+from src.utils import config
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(
+        description="Load test LyricsService against a local Genius/YouTube stub server."
+    )
+    parser.add_argument("--queries", type=int, nargs="+", default=[1000],
+                        help="Synthetic query set sizes (e.g., 1000 10000 100000)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32],
+                        help="Worker counts to compare")
+    parser.add_argument("--mode", nargs="+", choices=["threads", "scheduler"], default=["threads"],
+                        help="Per-query thread pool and/or the per-host scheduler")
+    parser.add_argument("--host-limit", action="append", default=[], metavar="HOST=N",
+                        help="Concurrent requests a stub host accepts before answering 429 "
+                             "(hosts: api.genius.com, genius.com, youtube.com)")
+    parser.add_argument("--latency-scale", type=float, default=1.0,
+                        help="Multiplier applied to the stub's per-route latencies")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of stub responses that fail with HTTP 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0,
+                        help="Fraction of stub responses that fail with HTTP 429")
+    parser.add_argument("--rate-limit", type=float, default=0.0,
+                        help="Requests per second before the stub answers 429 (0 = unlimited)")
+    parser.add_argument("--miss-rate", type=float, default=0.05,
+                        help="Fraction of queries that return no search hits")
+    parser.add_argument("--tail-rate", type=float, default=0.0,
+                        help="Fraction of stub responses delayed by --tail-ms")
+    parser.add_argument("--tail-ms", type=float, default=2000.0,
+                        help="Extra latency of slow tail responses in milliseconds")
+    parser.add_argument("--hedge", action="store_true",
+                        help="Enable hedged requests in the Genius client")
+    parser.add_argument("--parser-workers", type=int, default=config.PARSER_WORKERS,
+                        help="Processes parsing lyrics pages (0 parses in the fetching threads)")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Also report the peak Python heap with tracemalloc (slows the run down)")
+    args = parser.parse_args()
+
+    settings = StubSettings(
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        rate_limit=args.rate_limit,
+        miss_rate=args.miss_rate,
+        tail_rate=args.tail_rate,
+        tail_ms=args.tail_ms,
+        host_limits={host: int(limit) for host, _, limit in (item.partition("=") for item in args.host_limit)}
+    )
+    settings.latency_ms = {route: ms * args.latency_scale for route, ms in settings.latency_ms.items()}
+    settings.jitter_ms *= args.latency_scale
+
+    print(f"\n{'='*60}")
+    print(f"🎵 Lyrics Eater - Load test")
+    print(f"{'='*60}\n")
+
+    config.HEDGE_REQUESTS = args.hedge
+    config.PARSER_WORKERS = args.parser_workers
+
+    harness = LoadHarness(settings, trace_memory=args.trace_memory)
+    harness.sweep(args.queries, args.concurrency, args.mode)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,50 +1,249 @@
 #!/usr/bin/env python3
 
+import argparse
+import time
+
 from src.clients import GeniusAPIClient, YouTubeAPIClient
-from src.services import LyricsService
-from src.utils import config, FileHandler
+from src.services import (
+    CorpusAnalyzer, HostScheduler, LookupServer, LookupService, LyricsService, SectionProcessor
+)
+from src.services.analytics import STOPWORDS
+from src.utils import config, FileHandler, NegativeCache, SongStore
 
 
-def main() -> None:
+def run(args: argparse.Namespace) -> None:
 
     # Get the .env and searches.txt file.
     if not config.validate():
         print("\n Tip: Create a .env file with GENIUS_ACCESS_TOKEN=your_token")
         return
-    
-    searches = FileHandler.load_searches(config.SEARCHES_FILE)
-    
-    if not searches:
+
+    sections = FileHandler.load_search_sections(config.SEARCHES_FILE)
+
+    if not sections:
         print(f" Error: No searches found in '{config.SEARCHES_FILE}'")
         print(f" Tip: Create '{config.SEARCHES_FILE}' with one search per line")
         return
-    
+
+    if args.section:
+        by_name = {name.upper(): name for name in sections}
+        unknown = [name for name in args.section if name.upper() not in by_name]
+        if unknown:
+            print(f" Error: Unknown section(s): {', '.join(unknown)}")
+            print(f" Available sections: {', '.join(sections)}")
+            return
+        sections = {by_name[name.upper()]: sections[by_name[name.upper()]] for name in args.section}
+
+    total = sum(len(queries) for queries in sections.values())
+
     print(f"\n{'='*60}")
-    print(f"🎵 Lyrics Eater - Processing {len(searches)} searches")
+    print(f"🎵 Lyrics Eater - Processing {total} searches in {len(sections)} sections")
     print(f"{'='*60}\n")
-    
+
     # Initialize clients
     genius_client = GeniusAPIClient(config.GENIUS_ACCESS_TOKEN)
     youtube_client = YouTubeAPIClient()  # No API key needed
-    
+
     print("YouTube scraper enabled (no API limits!)\n")
-    
+
+    negative_cache = NegativeCache(config.STORE_FILE, ttl_days=config.NEGATIVE_CACHE_TTL_DAYS)
+    if args.retry_dead:
+        print(f"Retrying {len(negative_cache)} queries that previously returned no results\n")
+
     # Initialize service
-    lyrics_service = LyricsService(genius_client, youtube_client)
-    
-    songs, successful, failed = lyrics_service.process_multiple_queries(searches)
-    
+    lyrics_service = LyricsService(
+        genius_client,
+        youtube_client,
+        negative_cache=negative_cache,
+        retry_dead=args.retry_dead
+    )
+
+    # Sections processed at the same time share the per-host budgets.
+    concurrent_sections = min(len(sections), config.SECTION_WORKERS)
+    budgets = {
+        host: max(1, budget // concurrent_sections)
+        for host, budget in config.HOST_CONCURRENCY.items()
+    }
+    if args.scheduled:
+        print(f"Host scheduler budgets per section: {budgets}\n")
+
+    def process(queries, stop):
+        if args.scheduled:
+            return HostScheduler(lyrics_service, budgets=budgets).run(queries, stop=stop)
+        return lyrics_service.process_multiple_queries(queries, stop=stop)
+
+    # Each section is saved as soon as it completes. Spreadsheets are only
+    # written on request, so growing a large catalog stays cheap.
+    store = SongStore(config.STORE_FILE)
+
+    def flush(section, section_songs):
+        written = store.upsert_songs(section_songs)
+        print(f"\n [{section}] {written} songs upserted into {config.STORE_FILE}")
+        if args.export:
+            store.export_section(config.OUTPUT_FILE, section)
+
+    songs, successful, failed = SectionProcessor(process, flush).run(sections)
+    negative_cache.close()
+
     if songs:
         print(f"\n{'='*60}")
-        print(" Saving results...")
-        FileHandler.save_to_excel(songs, config.OUTPUT_FILE)
-        
         print(f"\n Process completed!")
-        print(f"    Successful: {successful}/{len(searches)}")
-        print(f"    Failed: {failed}/{len(searches)}")
-        print(f"    Output: {config.OUTPUT_FILE}")
+        print(f"    Successful: {successful}/{total}")
+        print(f"    Failed: {failed}/{total}")
+        print(f"    Catalog: {store.count()} songs in {config.STORE_FILE}")
+        print(f"    Pending YouTube enrichment: {sum(song.enrichment_pending for song in songs)}")
+        if args.export:
+            print(f"    Output: {FileHandler.section_filename(config.OUTPUT_FILE, '<section>')}")
+        else:
+            print(f"    Spreadsheet: run 'python main.py export' to generate {config.OUTPUT_FILE}")
     else:
         print("\n No songs were successfully processed")
+    store.close()
+
+    print(f"    {youtube_client.breaker.summary()}")
+
+
+def enrich(args: argparse.Namespace) -> None:
+
+    store = SongStore(config.STORE_FILE)
+    pending = store.load_pending_enrichment()
+
+    if not pending:
+        print(" No songs are waiting for YouTube enrichment")
+        store.close()
+        return
+
+    print(f"\n{'='*60}")
+    print(f"🎵 Lyrics Eater - Enriching {len(pending)} songs with YouTube links")
+    print(f"{'='*60}\n")
+
+    lyrics_service = LyricsService(GeniusAPIClient(config.GENIUS_ACCESS_TOKEN), YouTubeAPIClient())
+    enriched = lyrics_service.enrich_youtube(pending)
+    store.upsert_songs(pending)
+    store.close()
+
+    print(f"\n    Enriched: {enriched}/{len(pending)}")
+    print(f"    {lyrics_service.youtube_client.breaker.summary()}")
+    print(f"    Spreadsheet: run 'python main.py export' to update {config.OUTPUT_FILE}")
+
+
+def export(args: argparse.Namespace) -> None:
+
+    store = SongStore(config.STORE_FILE)
+    print(f" Exporting {store.count()} songs from {config.STORE_FILE}...")
+    store.export(args.output, by_section=args.by_section)
+    store.close()
+
+
+def analyze(args: argparse.Namespace) -> None:
+
+    store = SongStore(config.STORE_FILE)
+    songs = store.load_songs()
+    store.close()
+
+    started = time.perf_counter()
+    analyzer = CorpusAnalyzer(songs, top=args.top, stopwords=None if args.keep_stopwords else STOPWORDS)
+    tables = analyzer.run()
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{'='*60}")
+    print(f"🎵 Lyrics Eater - Corpus analytics")
+    print(f"{'='*60}")
+    print(f"    Songs with lyrics: {len(analyzer.corpus)}/{len(songs)}")
+    print(f"    Tokens: {len(analyzer.corpus.tokens)}")
+    print(f"    Vocabulary: {len(analyzer.corpus.vocab)}")
+    print(f"    Computed in {elapsed:.2f}s\n")
+
+    FileHandler.save_tables(tables, args.output)
+
+
+def serve(args: argparse.Namespace) -> None:
+
+    if not config.validate():
+        print("\n Tip: Create a .env file with GENIUS_ACCESS_TOKEN=your_token")
+        return
+
+    # Clients, caches and connection pools stay warm for the life of the server.
+    lyrics_service = LyricsService(
+        GeniusAPIClient(config.GENIUS_ACCESS_TOKEN),
+        YouTubeAPIClient(),
+        negative_cache=NegativeCache(config.STORE_FILE, ttl_days=config.NEGATIVE_CACHE_TTL_DAYS)
+    )
+    lookup_service = LookupService(
+        lyrics_service,
+        store=SongStore(config.STORE_FILE),
+        workers=args.workers,
+        queue_size=args.queue_size
+    )
+    server = LookupServer(lookup_service, host=args.host, port=args.port)
+
+    print(f"\n{'='*60}")
+    print(f"🎵 Lyrics Eater - Lookup server on {server.address}")
+    print(f"{'='*60}")
+    print("    GET  /lookup?q=Obsesion - Aventura")
+    print("    POST /lookup/batch  {\"queries\": [...]}")
+    print("    GET  /health\n")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n\n  Server stopped by user")
+    finally:
+        server.shutdown()
+
+
+def add_run_arguments(parser: argparse.ArgumentParser) -> None:
+
+    parser.add_argument("--retry-dead", action="store_true",
+                        help="Search again queries that returned no results on previous runs")
+    parser.add_argument("--scheduled", action="store_true",
+                        help="Process queries concurrently with per-host concurrency budgets")
+    parser.add_argument("--section", action="append", metavar="NAME",
+                        help="Only process this searches.txt section (repeatable), e.g. --section BACHATA")
+    parser.add_argument("--export", action="store_true",
+                        help="Also write each finished section to its own spreadsheet, e.g. dominican_songs_bachata.xlsx")
+    parser.set_defaults(func=run)
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description="Scrape song lyrics from Genius.")
+    add_run_arguments(parser)
+    subparsers = parser.add_subparsers(title="commands")
+
+    run_parser = subparsers.add_parser("run", help="Process searches and update the catalog (default)")
+    add_run_arguments(run_parser)
+
+    export_parser = subparsers.add_parser("export", help="Export the catalog to .xlsx, .csv or a .lyra archive")
+    export_parser.add_argument("-o", "--output", default=config.OUTPUT_FILE,
+                               help=f"Output file (default: {config.OUTPUT_FILE})")
+    export_parser.add_argument("--by-section", action="store_true",
+                               help="One sheet (one file for .csv) per searches.txt section")
+    export_parser.set_defaults(func=export)
+
+    enrich_parser = subparsers.add_parser("enrich", help="Retry YouTube lookups skipped by the circuit breaker")
+    enrich_parser.set_defaults(func=enrich)
+
+    analyze_parser = subparsers.add_parser("analyze", help="Compute word and repetition statistics for the catalog")
+    analyze_parser.add_argument("-o", "--output", default=config.ANALYTICS_FILE,
+                                help=f"Output file, one sheet per table (default: {config.ANALYTICS_FILE})")
+    analyze_parser.add_argument("--top", type=int, default=20,
+                                help="Top terms reported per artist and per genre")
+    analyze_parser.add_argument("--keep-stopwords", action="store_true",
+                                help="Include function words in the top-term tables")
+    analyze_parser.set_defaults(func=analyze)
+
+    serve_parser = subparsers.add_parser("serve", help="Run a local HTTP lookup server with warm caches")
+    serve_parser.add_argument("--host", default=config.SERVER_HOST)
+    serve_parser.add_argument("--port", type=int, default=config.SERVER_PORT)
+    serve_parser.add_argument("--workers", type=int, default=config.SERVER_WORKERS,
+                              help="Concurrent lookups against the backends")
+    serve_parser.add_argument("--queue-size", type=int, default=config.SERVER_QUEUE_SIZE,
+                              help="Maximum pending distinct queries before answering 503")
+    serve_parser.set_defaults(func=serve)
+
+    args = parser.parse_args()
+    args.func(args)
 
 
 if __name__ == "__main__":
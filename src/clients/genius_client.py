@@ -1,13 +1,15 @@
 """Genius API client for fetching song data."""
 
-import re
-import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, wait, FIRST_COMPLETED
 from typing import List, Optional, Dict
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
 from ..models.song import Song
 from ..utils.config import config
+from ..utils.latency import LatencyTracker
+from ..utils.lyrics_parser import LyricsParser
 
 
 class GeniusAPIClient:
@@ -15,33 +17,107 @@ class GeniusAPIClient:
     Client for interacting with Genius API.
     """
     
-    def __init__(self, access_token: str):
+    def __init__(
+        self,
+        access_token: str,
+        base_url: Optional[str] = None,
+        parser: Optional[LyricsParser] = None
+    ):
         """
         Initialize the Genius API client.
         
         Args:
             access_token: Genius API access token
+            base_url: Override for the API base URL (e.g., a local stub server)
+            parser: Parser for lyrics pages (default: the shared process pool)
         """
         self.access_token = access_token
-        self.base_url = config.GENIUS_BASE_URL
+        self.base_url = base_url or config.GENIUS_BASE_URL
+        self.latency = LatencyTracker()
         self._session = self._create_session()
+        self._page_session = self._create_session(authorized=False)
+        self._hedge_pool = ThreadPoolExecutor(max_workers=config.HTTP_POOL_SIZE * 2)
+        self.parser = parser or LyricsParser.shared()
     
-    def _create_session(self) -> requests.Session:
+    def _create_session(self, authorized: bool = True) -> requests.Session:
         """
-        Create a requests session with default headers.
+        Create a pooled requests session with default headers.
+        
+        Args:
+            authorized: Send the API token and user agent (False for genius.com pages)
         """
         session = requests.Session()
-        session.headers.update({
-            "Authorization": f"Bearer {self.access_token}",
-            "User-Agent": "LyricsEater/1.0"
-        })
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=config.HTTP_POOL_SIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if authorized:
+            session.headers.update({
+                "Authorization": f"Bearer {self.access_token}",
+                "User-Agent": "LyricsEater/1.0"
+            })
         return session
     
+    def _timeout(self, key: str, default: float, limit: Optional[float]) -> float:
+        """
+        Adaptive timeout for an endpoint, capped by the caller's limit.
+        """
+        timeout = self.latency.timeout_for(key, default)
+        return min(timeout, limit) if limit is not None else timeout
+    
+    def _timed_get(self, key: str, url: str, timeout: float, **kwargs) -> requests.Response:
+        getter = kwargs.pop("session", None) or requests
+        started = time.perf_counter()
+        try:
+            response = getter.get(url, timeout=timeout, **kwargs)
+        except requests.exceptions.Timeout:
+            self.latency.record(key, timeout)
+            raise
+        self.latency.record(key, time.perf_counter() - started)
+        return response
+    
+    def _get(self, key: str, url: str, timeout: float, **kwargs) -> requests.Response:
+        """
+        GET with optional hedging: if no response arrives within the endpoint's
+        p95 latency, a duplicate request is sent and the first success wins.
+        
+        Args:
+            key: Endpoint name used for latency tracking (e.g., 'search')
+            url: Request URL
+            timeout: Request timeout in seconds
+            **kwargs: Passed to requests (params, session)
+            
+        Returns:
+            The winning response
+        """
+        if timeout <= 0:
+            # No budget left before the query deadline; requests rejects 0.
+            raise requests.exceptions.Timeout(f"no time left for {key} request")
+        
+        delay = self.latency.hedge_delay(key)
+        if delay is None or delay >= timeout:
+            return self._timed_get(key, url, timeout, **kwargs)
+        
+        primary = self._hedge_pool.submit(self._timed_get, key, url, timeout, **kwargs)
+        try:
+            return primary.result(timeout=delay)
+        except FuturesTimeout:
+            pass
+        
+        backup = self._hedge_pool.submit(self._timed_get, key, url, timeout - delay, **kwargs)
+        pending = {primary, backup}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+        return primary.result()
+    
     def _make_request(
         self,
         endpoint: str,
         params: Optional[Dict] = None,
-        timeout: int = None
+        timeout: float = None,
+        key: str = "api"
     ) -> Optional[Dict]:
         """
         Make a GET request to Genius API.
@@ -49,16 +125,18 @@ class GeniusAPIClient:
         Args:
             endpoint: API endpoint (e.g., '/search')
             params: Query parameters
-            timeout: Request timeout in seconds
+            timeout: Upper bound for the request timeout in seconds
+                (e.g., the time left before a query deadline)
+            key: Endpoint name used for latency tracking
             
         Returns:
             API response data or None on error
         """
-        timeout = timeout or config.API_TIMEOUT
+        timeout = self._timeout(key, config.API_TIMEOUT, timeout)
         url = f"{self.base_url}{endpoint}"
         
         try:
-            response = self._session.get(url, params=params, timeout=timeout)
+            response = self._get(key, url, timeout, params=params, session=self._session)
             response.raise_for_status()
             result = response.json()
             
@@ -69,29 +147,31 @@ class GeniusAPIClient:
                 return None
                 
         except requests.exceptions.Timeout:
-            print(f" Timeout: Request exceeded {timeout}s")
+            print(f" Timeout: Request exceeded {timeout:.1f}s")
             return None
         except requests.exceptions.RequestException as e:
             print(f" Request Error: {e}")
             return None
     
-    def search(self, query: str, per_page: int = None) -> List[Dict]:
+    def search(self, query: str, per_page: int = None, timeout: float = None) -> Optional[List[Dict]]:
         """
         Search for songs on Genius.
         
         Args:
             query: Search query (e.g., "Obsesion Aventura")
             per_page: Number of results per page
+            timeout: Upper bound for the request timeout in seconds
             
         Returns:
-            List of song dictionaries
+            List of song dictionaries (empty if there were no hits),
+            or None if the request failed
         """
         per_page = per_page or config.RESULTS_PER_PAGE
         params = {"q": query, "per_page": per_page}
-        response = self._make_request("/search", params=params)
+        response = self._make_request("/search", params=params, timeout=timeout, key="search")
         
-        if not response:
-            return []
+        if response is None:
+            return None
         
         hits = response.get("hits", [])
         return [
@@ -104,17 +184,18 @@ class GeniusAPIClient:
             for hit in hits
         ]
     
-    def get_song_details(self, song_id: int) -> Optional[Song]:
+    def get_song_details(self, song_id: int, timeout: float = None) -> Optional[Song]:
         """
         Get detailed information about a song.
         
         Args:
             song_id: Genius song ID
+            timeout: Upper bound for the request timeout in seconds
             
         Returns:
             Song object or None on error
         """
-        response = self._make_request(f"/songs/{song_id}")
+        response = self._make_request(f"/songs/{song_id}", timeout=timeout, key="songs")
         
         if not response:
             return None
@@ -135,39 +216,35 @@ class GeniusAPIClient:
             lyrics="" 
         )
     
-    def scrape_lyrics(self, url: str, timeout: int = None) -> str:
+    def scrape_lyrics(self, url: str, timeout: float = None) -> str:
         """
         Scrape lyrics from a Genius song page.
         
         Args:
             url: Genius song URL
-            timeout: Request timeout in seconds
+            timeout: Upper bound for the request timeout in seconds
             
         Returns:
             Cleaned lyrics text or empty string on error
         """
-        timeout = timeout or config.SCRAPING_TIMEOUT
+        timeout = self._timeout("lyrics", config.SCRAPING_TIMEOUT, timeout)
         
         try:
-            response = requests.get(url, timeout=timeout)
+            response = self._get("lyrics", url, timeout, session=self._page_session)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            lyrics_divs = soup.find_all('div', attrs={'data-lyrics-container': 'true'})
+            # Parsing runs on the parser's worker processes; only the raw
+            # bytes are sent over and only the lyrics text comes back.
+            lyrics = self.parser.parse(response.content, response.encoding)
             
-            if not lyrics_divs:
+            if lyrics is None:
                 print(f"  No lyrics found at {url}")
                 return ""
             
-            # Extract and clean lyrics
-            lyrics = '\n'.join([div.get_text(separator="\n") for div in lyrics_divs])
-            lyrics = re.sub(r'[\(\[].*?[\)\]]', '', lyrics)  # Remove [Verse], [Chorus], etc.
-            lyrics = os.linesep.join([line for line in lyrics.splitlines() if line.strip()])
-            
             return lyrics
             
         except requests.exceptions.Timeout:
-            print(f"  Timeout: Scraping exceeded {timeout}s")
+            print(f"  Timeout: Scraping exceeded {timeout:.1f}s")
             return ""
         except requests.exceptions.RequestException as e:
             print(f" Scraping Error: {e}")
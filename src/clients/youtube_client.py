@@ -1,42 +1,156 @@
 """YouTube scraper client for fetching music video links."""
 
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed, wait
+from typing import Optional, Tuple
+import requests
 import scrapetube
+from requests.adapters import HTTPAdapter
+
+from ..utils.config import config
+from ..utils.circuit_breaker import CircuitBreaker
+from ..utils.latency import LatencyTracker
+
+
+class _TimeoutAdapter(HTTPAdapter):
+    """
+    HTTP adapter that applies a timeout to requests sent without one.
+    """
+
+    def __init__(self, timeout: float, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=self.timeout if timeout is None else timeout, **kwargs)
+
+
+_scrapetube_session = scrapetube.scrapetube.get_session
+
+
+def _session_with_timeout(proxies: dict = None) -> requests.Session:
+    # scrapetube sends its requests without a timeout, so a stalled search
+    # would hold its worker thread forever after the caller gave up on it.
+    session = _scrapetube_session(proxies)
+    adapter = _TimeoutAdapter(config.YOUTUBE_TIMEOUT)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+scrapetube.scrapetube.get_session = _session_with_timeout
 
 
 class YouTubeAPIClient:
     """
     Client for searching YouTube videos using scrapetube (no API key needed).
     """
-    
+
     def __init__(self):
         """
         Initialize YouTube scraper client.
         """
-        pass
-    
-    def search_music_video(self, title: str, artist: str) -> Optional[str]:
+        self.latency = LatencyTracker()
+        self.breaker = CircuitBreaker(
+            "YouTube",
+            failure_threshold=config.YOUTUBE_FAILURE_THRESHOLD,
+            cooldown=config.YOUTUBE_COOLDOWN,
+            empty_threshold=config.YOUTUBE_EMPTY_THRESHOLD
+        )
+        # Searches run on worker threads so the caller can stop waiting once
+        # its (adaptive) timeout expires; the abandoned search still ends
+        # within YOUTUBE_TIMEOUT per request, freeing its thread.
+        self._executor = ThreadPoolExecutor(max_workers=config.HTTP_POOL_SIZE)
+
+    def _find_video_id(self, query: str) -> Optional[str]:
+        """
+        Return the ID of the first video matching the query, if any.
+        """
+        videos = scrapetube.get_search(query, limit=1, sleep=0)
+
+        for video in videos:
+            video_id = video.get('videoId')
+            if video_id:
+                return video_id
+
+        return None
+
+    def search_music_video(self, title: str, artist: str, timeout: float = None) -> Optional[str]:
         """
         Search for a music video on YouTube using scrapetube.
-        
+
         Args:
             title: Song title
             artist: Artist name
-            
+            timeout: Upper bound for the search timeout in seconds
+
         Returns:
             YouTube video URL if found, None otherwise
         """
+        return self.find_music_video(title, artist, timeout)[0]
+
+    def find_music_video(self, title: str, artist: str, timeout: float = None) -> Tuple[Optional[str], bool]:
+        """
+        Search for a music video, reporting whether the search actually ran.
+
+        Failures (timeouts, errors) are counted by reason on `self.breaker`,
+        and searches without results separately; too many of either in a
+        row open the circuit, and while it is open no search is attempted.
+
+        Args:
+            title: Song title
+            artist: Artist name
+            timeout: Upper bound for the search timeout in seconds
+
+        Returns:
+            Tuple of (YouTube video URL or None, completed boolean). completed is
+            False when the search failed, was skipped by the circuit breaker,
+            or came back empty as part of a run long enough to open it.
+        """
+        limit = self.latency.timeout_for("youtube", config.YOUTUBE_TIMEOUT)
+        timeout = min(limit, timeout) if timeout is not None else limit
+        if timeout <= 0:
+            # Out of query budget: not a YouTube failure, so the breaker is left alone.
+            return None, False
+
+        if not self.breaker.allow():
+            return None, False
+
         try:
             query = f"{title} {artist}"
-            
-            videos = scrapetube.get_search(query, limit=1, sleep=0)
-            
-            for video in videos:
-                video_id = video.get('videoId')
-                if video_id:
-                    return f"https://www.youtube.com/watch?v={video_id}"
-            
-            return None
-            
+
+            started = time.perf_counter()
+            searches = [self._executor.submit(self._find_video_id, query)]
+
+            # Hedge slow searches with a duplicate; the first success wins.
+            delay = self.latency.hedge_delay("youtube")
+            if delay is not None and delay < timeout and not wait(searches, timeout=delay).done:
+                searches.append(self._executor.submit(self._find_video_id, query))
+
+            error = None
+            for search in as_completed(searches, timeout=timeout - (time.perf_counter() - started)):
+                error = search.exception()
+                if error is None:
+                    video_id = search.result()
+                    break
+            else:
+                self.breaker.record_failure(type(error).__name__)
+                return None, False
+
+            self.latency.record("youtube", time.perf_counter() - started)
+
+            if not video_id:
+                # Many songs have no video, so one empty result is a finished
+                # lookup; a long run of them means blocking or a markup change.
+                return None, self.breaker.record_success(empty=True)
+
+            self.breaker.record_success()
+            return f"https://www.youtube.com/watch?v={video_id}", True
+
+        except FuturesTimeout:
+            self.latency.record("youtube", timeout)
+            self.breaker.record_failure("timeout")
+            return None, False
         except Exception as e:
-            return None
+            self.breaker.record_failure(type(e).__name__)
+            return None, False
@@ -0,0 +1,14 @@
+"""Load testing tools: a local Genius/YouTube stand-in and a load harness."""
+
+from .stub_server import StubProcess, StubServer, StubSettings, StubYouTubeClient
+from .harness import LoadHarness, LoadResult, generate_queries
+
+__all__ = [
+    'StubServer',
+    'StubProcess',
+    'StubSettings',
+    'StubYouTubeClient',
+    'LoadHarness',
+    'LoadResult',
+    'generate_queries'
+]
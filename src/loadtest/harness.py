@@ -0,0 +1,256 @@
+"""Load harness that drives LyricsService against the local stub server."""
+
+import contextlib
+import multiprocessing
+import os
+import random
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from ..clients.genius_client import GeniusAPIClient
+from ..services.lyrics_service import LyricsService
+from ..services.scheduler import HOST_PRIORITY, HostScheduler
+from ..utils.lyrics_parser import LyricsParser
+from .stub_server import StubProcess, StubSettings, StubYouTubeClient
+
+
+def generate_queries(count: int, seed: int = 0) -> List[str]:
+    """
+    Build a synthetic query set in the "Title - Artist" format of searches.txt.
+
+    Args:
+        count: Number of queries to generate
+        seed: Random seed for reproducible query sets
+
+    Returns:
+        List of search queries
+    """
+    rng = random.Random(seed)
+    artists = [f"Artist {idx}" for idx in range(max(1, count // 20))]
+    return [f"Song {idx} - {rng.choice(artists)}" for idx in range(count)]
+
+
+def _max_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    unit = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / unit
+
+
+def _process_peak_rss_mb(pid: int) -> float:
+    # VmHWM rather than RUSAGE_CHILDREN: a child's ru_maxrss starts from the
+    # parent's RSS at fork, before the spawned interpreter replaces it.
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(percentile / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+@dataclass
+class LoadResult:
+    """
+    Outcome of one load run at a given query count and concurrency.
+    """
+    queries: int
+    concurrency: int
+    mode: str
+    successful: int
+    failed: int
+    complete: int
+    elapsed: float
+    p50_ms: float
+    p99_ms: float
+    rss_mb: float
+    parser_rss_mb: float
+    heap_mb: Optional[float] = None
+
+    @property
+    def throughput(self) -> float:
+        return self.queries / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def complete_throughput(self) -> float:
+        """
+        Songs per second that got both lyrics and a finished YouTube lookup.
+        """
+        return self.complete / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        heap = f" heap {self.heap_mb:6.1f} MB |" if self.heap_mb is not None else ""
+        return (
+            f"{self.queries:>7} queries | {self.concurrency:>3} workers | {self.mode:<9} | "
+            f"{self.throughput:8.1f} q/s | p50 {self.p50_ms:7.1f} ms | "
+            f"p99 {self.p99_ms:7.1f} ms | rss {self.rss_mb:6.1f} MB | "
+            f"parser rss {self.parser_rss_mb:6.1f} MB |{heap} "
+            f"ok {self.successful} (complete {self.complete}, {self.complete_throughput:.1f}/s) / failed {self.failed}"
+        )
+
+
+class LoadHarness:
+    """
+    Runs LyricsService against stub servers at different concurrency settings.
+
+    The stub runs in a child process, so throughput and memory figures are
+    those of the client alone. Memory is reported as the peak RSS of this
+    process (ru_maxrss, a high-water mark since the harness started, so a
+    sweep should go from small to large runs) and the largest peak RSS of
+    the run's lyrics parser workers (VmHWM; Linux only).
+    """
+
+    def __init__(self, settings: Optional[StubSettings] = None, trace_memory: bool = False):
+        """
+        Initialize the harness.
+
+        Args:
+            settings: Stub server behaviour settings
+            trace_memory: Also report the peak Python heap of each run with
+                tracemalloc (slows the run down, so throughput drops)
+        """
+        self.settings = settings or StubSettings()
+        self.trace_memory = trace_memory
+        self._stubs: Optional[StubProcess] = None
+
+    def run(self, queries: List[str], concurrency: int, mode: str = "threads") -> LoadResult:
+        """
+        Process all queries against a fresh stub server and fresh clients.
+
+        Args:
+            queries: Search queries to process
+            concurrency: Total number of worker threads
+            mode: 'threads' runs whole queries on a thread pool; 'scheduler'
+                runs their steps on a HostScheduler with the same number of
+                threads and the stub's per-host limits as caps
+
+        Returns:
+            LoadResult with throughput, latency percentiles and peak memory
+        """
+        if self._stubs is None:
+            with StubProcess(self.settings) as self._stubs:
+                try:
+                    return self.run(queries, concurrency, mode)
+                finally:
+                    self._stubs = None
+
+        # A parser of its own, so each run measures fresh parser workers.
+        parser = LyricsParser()
+        with self._stubs.serve() as base_url:
+            service = LyricsService(
+                GeniusAPIClient("stub-token", base_url=base_url, parser=parser),
+                StubYouTubeClient(base_url)
+            )
+
+            def timed(query: str):
+                started = time.perf_counter()
+                try:
+                    song, success = service.process_search_query(query)
+                except Exception:
+                    song, success = None, False
+                return (time.perf_counter() - started) * 1000, song if success else None
+
+            # The service reports progress on stdout; keep the report readable.
+            # Discard it rather than buffer it, so it does not count as memory.
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                if self.trace_memory:
+                    tracemalloc.start()
+                started = time.perf_counter()
+                if mode == "scheduler":
+                    outcomes = self._run_scheduled(service, queries, concurrency)
+                else:
+                    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                        outcomes = list(executor.map(timed, queries))
+                elapsed = time.perf_counter() - started
+
+                heap = None
+                if self.trace_memory:
+                    heap = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+                    tracemalloc.stop()
+
+        parser_rss = max(
+            (_process_peak_rss_mb(child.pid) for child in multiprocessing.active_children()
+             if child.pid != self._stubs.pid),
+            default=0.0
+        )
+        parser.close()
+
+        latencies = sorted(latency for latency, _ in outcomes)
+        songs = [song for _, song in outcomes if song]
+        complete = sum(
+            1 for song in songs
+            if song.lyrics != "N/A" and not song.enrichment_pending
+        )
+
+        return LoadResult(
+            queries=len(queries),
+            concurrency=concurrency,
+            mode=mode,
+            successful=len(songs),
+            failed=len(queries) - len(songs),
+            complete=complete,
+            elapsed=elapsed,
+            p50_ms=_percentile(latencies, 50),
+            p99_ms=_percentile(latencies, 99),
+            rss_mb=_max_rss_mb(),
+            parser_rss_mb=parser_rss,
+            heap_mb=heap
+        )
+
+    def _run_scheduled(self, service: LyricsService, queries: List[str], concurrency: int):
+        # Same number of threads as the thread pool; each host is capped at
+        # the stub's limit for it (if any), so the comparison is at equal budgets.
+        budgets = {host: self.settings.host_limits.get(host, concurrency) for host in HOST_PRIORITY}
+        scheduler = HostScheduler(service, budgets=budgets, workers=concurrency)
+        songs, _, _ = scheduler.run(queries, show_progress=False)
+        # Only the totals are reported, so songs need not line up with latencies.
+        return list(zip(scheduler.latencies, songs + [None] * (len(queries) - len(songs))))
+
+    def sweep(
+        self,
+        query_counts: List[int],
+        concurrencies: List[int],
+        modes: List[str] = None
+    ) -> List[LoadResult]:
+        """
+        Run every combination of query-set size, concurrency and mode.
+
+        Args:
+            query_counts: Sizes of the synthetic query sets (e.g., 1000, 100000)
+            concurrencies: Worker counts to compare
+            modes: 'threads' and/or 'scheduler'
+
+        Returns:
+            List of LoadResult, one per combination
+        """
+        results = []
+        with StubProcess(self.settings) as self._stubs:
+            try:
+                for count in query_counts:
+                    queries = generate_queries(count, seed=self.settings.seed)
+                    for concurrency in concurrencies:
+                        for mode in modes or ["threads"]:
+                            result = self.run(queries, concurrency, mode)
+                            print(f" {result.summary()}")
+                            results.append(result)
+            finally:
+                self._stubs = None
+        return results
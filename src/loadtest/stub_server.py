@@ -0,0 +1,403 @@
+"""Local stand-in for the Genius API, genius.com pages and YouTube search."""
+
+import contextlib
+import json
+import multiprocessing
+import random
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urlparse, parse_qs
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..clients.youtube_client import YouTubeAPIClient
+from ..utils.config import config
+
+
+@dataclass
+class StubSettings:
+    """
+    Behaviour knobs for the stub server.
+
+    Latencies are in milliseconds and keyed by route name
+    ('search', 'songs', 'lyrics', 'youtube').
+    """
+    latency_ms: Dict[str, float] = field(default_factory=lambda: {
+        'search': 80.0,
+        'songs': 60.0,
+        'lyrics': 150.0,
+        'youtube': 200.0,
+    })
+    jitter_ms: float = 20.0
+    tail_rate: float = 0.0
+    tail_ms: float = 2000.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    rate_limit: float = 0.0
+    retry_after: int = 1
+    miss_rate: float = 0.05
+    lyrics_lines: int = 40
+    host_limits: Dict[str, int] = field(default_factory=dict)
+    seed: int = 0
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket used to emulate a requests-per-second limit.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+ROUTE_HOSTS = {
+    'search': 'api.genius.com',
+    'songs': 'api.genius.com',
+    'lyrics': 'genius.com',
+    'youtube': 'youtube.com',
+}
+
+
+def _song_id(query: str) -> int:
+    return zlib.crc32(query.strip().lower().encode('utf-8')) or 1
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """
+    Serves synthetic /search, /songs/{id}, /lyrics/{id} and /youtube/search.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        parts = [part for part in parsed.path.split('/') if part]
+
+        if parts == ['search']:
+            route = 'search'
+        elif len(parts) == 2 and parts[0] == 'songs':
+            route = 'songs'
+        elif len(parts) == 2 and parts[0] == 'lyrics':
+            route = 'lyrics'
+        elif parts == ['youtube', 'search']:
+            route = 'youtube'
+        else:
+            self._send(404, b'not found', 'text/plain')
+            return
+
+        stub = self.server.stub
+        stub.count(route)
+
+        host = ROUTE_HOSTS[route]
+        if not stub.enter(host):
+            self._send_throttled(stub)
+            return
+        try:
+            self._respond(stub, route, parts, params)
+        finally:
+            stub.leave(host)
+
+    def _respond(self, stub: "StubServer", route: str, parts: List[str], params: Dict) -> None:
+        if (stub.bucket and not stub.bucket.take()) or stub.roll(stub.settings.throttle_rate):
+            self._send_throttled(stub)
+            return
+
+        stub.sleep(route)
+
+        if stub.roll(stub.settings.error_rate):
+            stub.count('5xx')
+            self._send(500, b'{"meta": {"status": 500}}', 'application/json')
+            return
+
+        if route == 'search':
+            self._send_json(stub.search_payload(params.get('q', '')))
+        elif route == 'songs':
+            self._send_json(stub.song_payload(int(parts[1])))
+        elif route == 'lyrics':
+            self._send(200, stub.lyrics_page(int(parts[1])), 'text/html; charset=utf-8')
+        else:
+            self._send_json({'videoId': f"stub{_song_id(params.get('q', '')):010d}"})
+
+    def _send_throttled(self, stub: "StubServer") -> None:
+        stub.count('429')
+        self._send(429, b'{"meta": {"status": 429}}', 'application/json',
+                   {'Retry-After': str(stub.settings.retry_after)})
+
+    def _send_json(self, payload: Dict) -> None:
+        self._send(200, json.dumps(payload).encode('utf-8'), 'application/json')
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Dict = None) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up (timeout or a hedged duplicate won).
+            self.close_connection = True
+
+
+class StubServer:
+    """
+    Threaded HTTP server emulating the three backends the pipeline talks to.
+
+    Usage:
+        with StubServer(StubSettings(error_rate=0.01)) as stub:
+            client = GeniusAPIClient("token", base_url=stub.base_url)
+    """
+
+    def __init__(self, settings: Optional[StubSettings] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the stub server (not started yet).
+
+        Args:
+            settings: Stub behaviour settings
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.settings = settings or StubSettings()
+        self.bucket = _TokenBucket(self.settings.rate_limit) if self.settings.rate_limit else None
+        self.stats: Dict[str, int] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._random = random.Random(self.settings.seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _StubHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.request_queue_size = 1024
+        self._httpd.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+    def enter(self, host: str) -> bool:
+        """
+        Admit a request unless the host's concurrency limit is reached.
+        """
+        limit = self.settings.host_limits.get(host)
+        with self._lock:
+            in_flight = self._in_flight.get(host, 0)
+            if limit and in_flight >= limit:
+                return False
+            self._in_flight[host] = in_flight + 1
+            return True
+
+    def leave(self, host: str) -> None:
+        with self._lock:
+            self._in_flight[host] -= 1
+
+    def roll(self, probability: float) -> bool:
+        if probability <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < probability
+
+    def sleep(self, route: str) -> None:
+        latency = self.settings.latency_ms.get(route, 0.0)
+        with self._lock:
+            jitter = self._random.uniform(-self.settings.jitter_ms, self.settings.jitter_ms)
+        if self.roll(self.settings.tail_rate):
+            latency += self.settings.tail_ms
+        delay = max(0.0, latency + jitter) / 1000
+        if delay:
+            time.sleep(delay)
+
+    def search_payload(self, query: str) -> Dict:
+        song_id = _song_id(query)
+        hits = []
+        if (song_id % 10000) >= self.settings.miss_rate * 10000:
+            hits.append({"result": self._song(song_id, query)})
+        return {"meta": {"status": 200}, "response": {"hits": hits}}
+
+    def song_payload(self, song_id: int) -> Dict:
+        song = self._song(song_id, f"Song {song_id}")
+        song.update({
+            "album": {"name": f"Album {song_id % 97}", "label": f"Label {song_id % 13}"},
+            "tags": [{"name": genre} for genre in ("Bachata", "Merengue", "Dembow")[: song_id % 3 + 1]],
+            "release_date_for_display": f"{1990 + song_id % 35}",
+        })
+        return {"meta": {"status": 200}, "response": {"song": song}}
+
+    def lyrics_page(self, song_id: int) -> bytes:
+        rng = random.Random(song_id)
+        words = ["amor", "corazón", "noche", "baila", "tú", "yo", "quiero", "siempre", "mi", "vida"]
+        lines = [
+            " ".join(rng.choice(words) for _ in range(rng.randint(3, 8)))
+            for _ in range(self.settings.lyrics_lines)
+        ]
+        half = len(lines) // 2
+        containers = [
+            '<div data-lyrics-container="true">[Verse]<br/>' + "<br/>".join(lines[:half]) + '</div>',
+            '<div data-lyrics-container="true">[Chorus]<br/>' + "<br/>".join(lines[half:]) + '</div>',
+        ]
+        padding = '<div class="filler">' + ('x' * 2000) + '</div>'
+        html = f"<html><head><title>{song_id}</title></head><body>{padding}{''.join(containers)}{padding}</body></html>"
+        return html.encode('utf-8')
+
+    def _song(self, song_id: int, query: str) -> Dict:
+        title, _, artist = query.partition(' - ')
+        return {
+            "id": song_id,
+            "title": title.strip() or f"Song {song_id}",
+            "primary_artist": {"name": artist.strip() or f"Artist {song_id % 500}"},
+            "url": f"{self.base_url}/lyrics/{song_id}",
+        }
+
+
+def _serve_stubs(settings: StubSettings, host: str, conn) -> None:
+    # Child process loop: a fresh StubServer per "start", stopped on "stop".
+    server = None
+    while True:
+        command = conn.recv()
+        if command == "start":
+            server = StubServer(settings, host).start()
+            conn.send(server.base_url)
+        elif command == "stop":
+            server.stop()
+            server = None
+            conn.send(None)
+        else:
+            break
+
+
+class StubProcess:
+    """
+    Runs stub servers in a child process, so the stub neither shares the GIL
+    with the client under test nor shows up in its memory figures.
+
+    The child lives as long as the StubProcess; each `serve()` starts a fresh
+    StubServer in it (same settings, reset counters and random rolls).
+
+    Usage:
+        with StubProcess(StubSettings(error_rate=0.01)) as stubs:
+            with stubs.serve() as base_url:
+                client = GeniusAPIClient("token", base_url=base_url)
+    """
+
+    def __init__(self, settings: Optional[StubSettings] = None, host: str = "127.0.0.1"):
+        """
+        Initialize the stub process (not started yet).
+
+        Args:
+            settings: Stub behaviour settings
+            host: Interface the stub servers bind
+        """
+        self.settings = settings or StubSettings()
+        self.host = host
+        self._conn = None
+        self._process = None
+
+    def start(self) -> "StubProcess":
+        # spawn: the child must not inherit the parent's threads and sockets
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=_serve_stubs, args=(self.settings, self.host, child_conn), daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        return self
+
+    @contextlib.contextmanager
+    def serve(self) -> Iterator[str]:
+        """
+        Start a fresh stub server in the child process.
+
+        Yields:
+            Base URL of the running server
+        """
+        self._conn.send("start")
+        base_url = self._conn.recv()
+        try:
+            yield base_url
+        finally:
+            self._conn.send("stop")
+            self._conn.recv()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process else None
+
+    def stop(self) -> None:
+        self._conn.send("exit")
+        self._process.join()
+        self._conn.close()
+
+    def __enter__(self) -> "StubProcess":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+class StubYouTubeClient(YouTubeAPIClient):
+    """
+    YouTube client that queries the stub server instead of scraping YouTube.
+    """
+
+    def __init__(self, base_url: str):
+        """
+        Initialize the stub YouTube client.
+
+        Args:
+            base_url: Base URL of a running StubServer
+        """
+        super().__init__()
+        self.base_url = base_url
+        self._session = requests.Session()
+        self._session.mount("http://", HTTPAdapter(pool_maxsize=config.HTTP_POOL_SIZE))
+
+    def _find_video_id(self, query: str) -> Optional[str]:
+        response = self._session.get(
+            f"{self.base_url}/youtube/search",
+            params={"q": query},
+            timeout=config.YOUTUBE_TIMEOUT
+        )
+        response.raise_for_status()
+        return response.json().get('videoId')
@@ -1,7 +1,7 @@
 """Data models for song information."""
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 
 @dataclass
@@ -19,6 +19,13 @@ class Song:
     release_date: str
     lyrics: str
     youtube_url: str = "N/A"
+    enrichment_pending: bool = False
+    section: Optional[str] = None
+    
+    EXPORT_COLUMNS = (
+        'genero', 'artista', 'cancion', 'letras',
+        'enlace_genius', 'enlace_youtube', 'discografica'
+    )
     
     def to_dict(self) -> dict:
         """
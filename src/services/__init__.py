@@ -1,5 +1,9 @@
 """Services layer. """
 
-from .lyrics_service import LyricsService
+from .lyrics_service import LyricsService, UpstreamError
+from .lookup_server import LookupService, LookupServer, QueueFullError
+from .analytics import CorpusAnalyzer
+from .scheduler import HostScheduler
+from .sections import SectionProcessor
 
-__all__ = ['LyricsService']
+__all__ = ['LyricsService', 'UpstreamError', 'LookupService', 'LookupServer', 'QueueFullError', 'CorpusAnalyzer', 'HostScheduler', 'SectionProcessor']
@@ -0,0 +1,281 @@
+"""Corpus analytics over scraped lyrics using batched NumPy operations."""
+
+import re
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.models.song import Song
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Function words left out of the top-term tables (not of the counts); tokens
+# with digits or underscores are left out too.
+STOPWORDS = frozenset("""
+a al como con de del el en es esa ese eso esta este esto ha la las le les lo los me mi
+mis ni no nos o para pero por que qué se si sí sin su sus te ti tu tus un una uno y ya
+yo tú él ella
+i a an and are be but for in is it me my of on so that the to you your
+""".split())
+
+
+class _Vocabulary(dict):
+    """
+    Maps strings to consecutive IDs, assigning the next ID on first lookup.
+    """
+
+    def __missing__(self, key: str) -> int:
+        self[key] = value = len(self)
+        return value
+
+    def strings(self) -> np.ndarray:
+        # dicts keep insertion order, so position i holds the string with ID i
+        return np.array(list(self), dtype=object)
+
+
+def _stripped_lines(text: str) -> Iterable[str]:
+    for line in text.splitlines():
+        line = line.strip()
+        if line:
+            yield line
+
+
+class TokenizedCorpus:
+    """
+    Lyrics corpus tokenized once into compact integer arrays.
+
+    Attributes:
+        vocab: Token strings, indexed by token ID
+        tokens: Token IDs of every song, concatenated (int32)
+        offsets: Start of each song in `tokens`; song i is tokens[offsets[i]:offsets[i + 1]]
+        lines: Line IDs of every song, concatenated (int32); IDs are numbered
+            within each song, since only repeats inside a song are counted
+        line_offsets: Start of each song in `lines`
+    """
+
+    def __init__(self, songs: List[Song]):
+        """
+        Tokenize the lyrics of the given songs.
+
+        Args:
+            songs: Songs to analyze (songs without lyrics are skipped)
+        """
+        self.songs = [song for song in songs if song.lyrics and song.lyrics != "N/A"]
+
+        # One song at a time: only that song's lowercased text and token list
+        # are alive, and each token goes straight into an int32 buffer.
+        token_ids = _Vocabulary()
+        tokens = array('i')
+        lines = array('i')
+        self.offsets = np.zeros(len(self.songs) + 1, dtype=np.int64)
+        self.line_offsets = np.zeros(len(self.songs) + 1, dtype=np.int64)
+
+        for idx, song in enumerate(self.songs, start=1):
+            text = song.lyrics.lower()
+            tokens.extend(map(token_ids.__getitem__, TOKEN_PATTERN.findall(text)))
+            lines.extend(map(_Vocabulary().__getitem__, _stripped_lines(text)))
+            self.offsets[idx] = len(tokens)
+            self.line_offsets[idx] = len(lines)
+
+        self.tokens = np.frombuffer(tokens, dtype=np.int32) if tokens else np.zeros(0, dtype=np.int32)
+        self.lines = np.frombuffer(lines, dtype=np.int32) if lines else np.zeros(0, dtype=np.int32)
+        self.vocab = token_ids.strings()
+
+    def __len__(self) -> int:
+        return len(self.songs)
+
+
+def _distinct_per_segment(values: np.ndarray, segment: np.ndarray, segments: int, width: int) -> np.ndarray:
+    """
+    Count distinct values within each segment in one vectorized pass.
+    """
+    if not len(values):
+        return np.zeros(segments, dtype=np.int64)
+    keys = np.unique(segment.astype(np.int64) * width + values)
+    return np.bincount(keys // width, minlength=segments)
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    return np.divide(
+        numerator, denominator,
+        out=np.zeros(len(numerator), dtype=np.float64),
+        where=denominator > 0
+    )
+
+
+class CorpusAnalyzer:
+    """
+    Computes word frequencies, vocabulary richness and repetition statistics
+    for the whole corpus and per artist / per genre.
+    """
+
+    def __init__(self, songs: List[Song], top: int = 20, stopwords: Optional[frozenset] = STOPWORDS):
+        """
+        Tokenize the corpus.
+
+        Args:
+            songs: Songs to analyze
+            top: Number of top terms reported per group
+            stopwords: Words excluded from top-term tables (None keeps all)
+        """
+        self.corpus = TokenizedCorpus(songs)
+        self.top = top
+        self._width = max(1, len(self.corpus.vocab))
+        self._token_song = np.repeat(
+            np.arange(len(self.corpus), dtype=np.int64), np.diff(self.corpus.offsets)
+        )
+        self._song_stats: Optional[pd.DataFrame] = None
+        self._term_mask = np.ones(len(self.corpus.vocab), dtype=bool)
+        if stopwords:
+            self._term_mask &= ~np.isin(self.corpus.vocab, list(stopwords))
+        self._term_mask &= np.fromiter(
+            (term.isalpha() for term in self.corpus.vocab), dtype=bool, count=len(self.corpus.vocab)
+        )
+
+    def song_stats(self) -> pd.DataFrame:
+        """
+        Per-song token counts, vocabulary richness and repetition ratios.
+
+        Returns:
+            DataFrame with one row per song
+        """
+        if self._song_stats is not None:
+            return self._song_stats
+
+        corpus = self.corpus
+        songs = len(corpus)
+        token_counts = np.diff(corpus.offsets)
+        line_counts = np.diff(corpus.line_offsets)
+
+        line_song = np.repeat(np.arange(songs), line_counts)
+        unique_tokens = _distinct_per_segment(corpus.tokens, self._token_song, songs, self._width)
+        unique_lines = _distinct_per_segment(corpus.lines, line_song, songs, int(corpus.lines.max(initial=0)) + 1)
+
+        type_token_ratio = _ratio(unique_tokens, token_counts)
+        self._song_stats = pd.DataFrame({
+            'song_id': [song.song_id for song in corpus.songs],
+            'artist': [song.artist for song in corpus.songs],
+            'title': [song.title for song in corpus.songs],
+            'tokens': token_counts,
+            'unique_tokens': unique_tokens,
+            'type_token_ratio': type_token_ratio.round(4),
+            'word_repetition': (1 - type_token_ratio).round(4),
+            'lines': line_counts,
+            'line_repetition': (1 - _ratio(unique_lines, line_counts)).round(4),
+        })
+        return self._song_stats
+
+    def term_frequencies(self) -> pd.DataFrame:
+        """
+        Corpus-wide word frequencies (stopwords excluded), most frequent first.
+        """
+        vocab_size = len(self.corpus.vocab)
+        counts = np.bincount(self.corpus.tokens, minlength=vocab_size)
+        song_keys = np.unique(self._token_song * self._width + self.corpus.tokens)
+        document_counts = np.bincount(song_keys % self._width, minlength=vocab_size)
+        ids = np.flatnonzero(self._term_mask & (counts > 0))
+        ids = ids[np.argsort(-counts[ids], kind='stable')]
+        total = max(1, int(counts.sum()))
+        return pd.DataFrame({
+            'term': self.corpus.vocab[ids],
+            'count': counts[ids],
+            'songs': document_counts[ids],
+            'share': (counts[ids] / total).round(6),
+        })
+
+    def group_stats(self, field: str) -> Dict[str, pd.DataFrame]:
+        """
+        Aggregate statistics and top terms per artist or per genre.
+
+        Genres are comma-separated on Song.genres, so a song counts towards
+        each of its genres.
+
+        Args:
+            field: 'artist' or 'genres'
+
+        Returns:
+            Dict with 'summary' (one row per group) and 'terms' (top terms per group)
+        """
+        corpus = self.corpus
+        width = self._width
+        per_song = self.song_stats()
+
+        pair_song, pair_name = [], []
+        for idx, song in enumerate(corpus.songs):
+            value = getattr(song, field) or "N/A"
+            names = [name.strip() for name in value.split(',')] if field == 'genres' else [value]
+            for name in names:
+                if name:
+                    pair_song.append(idx)
+                    pair_name.append(name)
+
+        pair_song = np.asarray(pair_song, dtype=np.int64)
+        pair_group, groups = pd.factorize(np.asarray(pair_name, dtype=object))
+        group_count = len(groups)
+
+        # Gather the token ranges of every (song, group) pair into one array.
+        starts = corpus.offsets[pair_song]
+        lengths = corpus.offsets[pair_song + 1] - starts
+        total = int(lengths.sum())
+        pair_start = np.cumsum(lengths) - lengths
+        token_index = np.repeat(starts - pair_start, lengths) + np.arange(total)
+        tokens = corpus.tokens[token_index]
+        token_group = np.repeat(pair_group, lengths).astype(np.int64)
+
+        keys, counts = np.unique(token_group * width + tokens, return_counts=True)
+        key_group = keys // width
+        key_token = keys % width
+
+        summary = pd.DataFrame({
+            field.rstrip('s'): groups,
+            'songs': np.bincount(pair_group, minlength=group_count),
+            'tokens': np.bincount(pair_group, weights=lengths, minlength=group_count).astype(np.int64),
+            'vocabulary': np.bincount(key_group, minlength=group_count),
+        })
+        summary['type_token_ratio'] = _ratio(summary['vocabulary'].to_numpy(), summary['tokens'].to_numpy()).round(4)
+        for column in ('word_repetition', 'line_repetition'):
+            values = per_song[column].to_numpy()[pair_song]
+            summary[f'mean_{column}'] = _ratio(
+                np.bincount(pair_group, weights=values, minlength=group_count),
+                summary['songs'].to_numpy()
+            ).round(4)
+        summary = summary.sort_values('songs', ascending=False, kind='stable').reset_index(drop=True)
+
+        # Top terms per group: sort by group, then by descending count, and
+        # keep the first `top` rows of each group.
+        keep = self._term_mask[key_token]
+        key_group, key_token, counts = key_group[keep], key_token[keep], counts[keep]
+        order = np.lexsort((-counts, key_group))
+        key_group, key_token, counts = key_group[order], key_token[order], counts[order]
+        group_start = np.searchsorted(key_group, np.arange(group_count))
+        rank = np.arange(len(key_group)) - group_start[key_group]
+        top = rank < self.top
+
+        terms = pd.DataFrame({
+            field.rstrip('s'): groups[key_group[top]],
+            'rank': rank[top] + 1,
+            'term': corpus.vocab[key_token[top]],
+            'count': counts[top],
+        })
+        return {'summary': summary, 'terms': terms}
+
+    def run(self) -> Dict[str, pd.DataFrame]:
+        """
+        Compute every table of the analytics report.
+
+        Returns:
+            Dict mapping table name to DataFrame
+        """
+        artists = self.group_stats('artist')
+        genres = self.group_stats('genres')
+        return {
+            'songs': self.song_stats(),
+            'terms': self.term_frequencies().head(max(self.top * 50, 1000)),
+            'artists': artists['summary'],
+            'artist_terms': artists['terms'],
+            'genres': genres['summary'],
+            'genre_terms': genres['terms'],
+        }
@@ -0,0 +1,315 @@
+"""Long-running lookup service with warm clients, caching and request coalescing."""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+from src.models.song import Song
+from src.services.lyrics_service import LyricsService, UpstreamError
+from src.utils.config import config
+from src.utils.negative_cache import normalize_query
+from src.utils.song_store import SongStore
+
+
+class QueueFullError(Exception):
+    """
+    Raised when the lookup queue has no room for another query.
+    """
+
+
+class LookupService:
+    """
+    Serves lookups from a warm LyricsService.
+
+    Found songs are kept in an in-memory LRU cache, concurrent lookups of the same
+    query share one in-flight request, and at most `queue_size` distinct
+    queries may be pending at once.
+    """
+
+    def __init__(
+        self,
+        lyrics_service: LyricsService,
+        store: Optional[SongStore] = None,
+        workers: int = None,
+        queue_size: int = None,
+        cache_size: int = None,
+        cache_ttl: float = None
+    ):
+        """
+        Initialize the lookup service.
+
+        Args:
+            lyrics_service: Service used to resolve cache misses
+            store: Catalog that found songs are upserted into
+            workers: Number of lookup worker threads
+            queue_size: Maximum number of pending distinct queries
+            cache_size: Maximum number of cached results
+            cache_ttl: Seconds a cached result stays valid
+        """
+        self.lyrics_service = lyrics_service
+        self.store = store
+        self.queue_size = queue_size or config.SERVER_QUEUE_SIZE
+        self.cache_size = cache_size or config.LOOKUP_CACHE_SIZE
+        self.cache_ttl = cache_ttl or config.LOOKUP_CACHE_TTL
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "rejected": 0}
+        self._executor = ThreadPoolExecutor(max_workers=workers or config.SERVER_WORKERS)
+        self._cache: "OrderedDict[str, Tuple[float, Song]]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, query: str) -> Future:
+        """
+        Start (or join) a lookup without waiting for it.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Future resolving to a Song, or None if nothing was found; it
+            raises UpstreamError if Genius could not answer
+
+        Raises:
+            QueueFullError: If the pending-query limit is reached
+        """
+        key = normalize_query(query)
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                self.stats["hits"] += 1
+                future = Future()
+                future.set_result(cached[1])
+                return future
+
+            if key in self._inflight:
+                self.stats["coalesced"] += 1
+                return self._inflight[key]
+
+            if len(self._inflight) >= self.queue_size:
+                self.stats["rejected"] += 1
+                raise QueueFullError(f"Lookup queue is full ({self.queue_size} pending)")
+
+            self.stats["misses"] += 1
+            future = self._executor.submit(self._resolve, key, query)
+            self._inflight[key] = future
+            return future
+
+    def _resolve(self, key: str, query: str) -> Optional[Song]:
+        try:
+            song = self.lyrics_service.lookup(query)
+
+            if not song:
+                # Dead queries are remembered by the LyricsService negative
+                # cache, so misses are not cached here; failures raise and
+                # stay retryable.
+                return None
+
+            if self.store:
+                self.store.upsert_songs([song])
+
+            with self._lock:
+                self._cache[key] = (time.monotonic() + self.cache_ttl, song)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            return song
+
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def lookup(self, query: str, timeout: float = None) -> Optional[Song]:
+        """
+        Look up a single query.
+
+        Args:
+            query: Search query
+            timeout: Seconds to wait for the result
+
+        Returns:
+            Song object or None if nothing was found
+
+        Raises:
+            UpstreamError: If Genius could not answer
+        """
+        return self.submit(query).result(timeout=timeout or config.QUERY_DEADLINE)
+
+    def lookup_many(self, queries: List[str], timeout: float = None) -> List[Dict]:
+        """
+        Look up a batch of queries concurrently.
+
+        Args:
+            queries: Search queries
+            timeout: Seconds to wait for the whole batch
+
+        Returns:
+            One result dict per query, in order, with 'query', 'status' and 'song'.
+            status is 'found', 'not_found', 'error' (Genius could not answer
+            or the lookup failed), 'timeout' or 'rejected'.
+        """
+        futures = []
+        for query in queries:
+            try:
+                futures.append(self.submit(query))
+            except QueueFullError:
+                futures.append(None)
+
+        wait([future for future in futures if future], timeout=timeout or config.QUERY_DEADLINE)
+
+        results = []
+        for query, future in zip(queries, futures):
+            if future is None:
+                results.append({"query": query, "status": "rejected", "song": None})
+            elif not future.done():
+                results.append({"query": query, "status": "timeout", "song": None})
+            elif future.exception() is not None:
+                results.append({"query": query, "status": "error", "song": None})
+            else:
+                song = future.result()
+                results.append({
+                    "query": query,
+                    "status": "found" if song else "not_found",
+                    "song": asdict(song) if song else None
+                })
+        return results
+
+    def health(self) -> Dict:
+        with self._lock:
+            cached = len(self._cache)
+            pending = len(self._inflight)
+        return {
+            "status": "ok",
+            "cached": cached,
+            "pending": pending,
+            "stats": dict(self.stats),
+            "youtube_breaker": self.lyrics_service.youtube_client.breaker.snapshot(),
+            "latency_ms": {
+                "genius": self.lyrics_service.genius_client.latency.snapshot(),
+                "youtube": self.lyrics_service.youtube_client.latency.snapshot()
+            }
+        }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _LookupHandler(BaseHTTPRequestHandler):
+    """
+    GET /lookup?q=..., POST /lookup/batch {"queries": [...]}, GET /health
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        service = self.server.lookup_service
+
+        if parsed.path == '/health':
+            self._send_json(200, service.health())
+            return
+
+        if parsed.path != '/lookup':
+            self._send_json(404, {"error": "not found"})
+            return
+
+        query = parse_qs(parsed.query).get('q', [''])[0].strip()
+        if not query:
+            self._send_json(400, {"error": "missing 'q' parameter"})
+            return
+
+        try:
+            song = service.lookup(query)
+        except QueueFullError as e:
+            self._send_json(503, {"error": str(e)})
+            return
+        except UpstreamError as e:
+            self._send_json(502, {"query": query, "status": "error", "error": str(e)})
+            return
+        except TimeoutError:
+            self._send_json(504, {"error": "lookup timed out"})
+            return
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+            return
+
+        if song:
+            self._send_json(200, {"query": query, "status": "found", "song": asdict(song)})
+        else:
+            self._send_json(404, {"query": query, "status": "not_found", "song": None})
+
+    def do_POST(self):
+        service = self.server.lookup_service
+
+        if urlparse(self.path).path != '/lookup/batch':
+            self._send_json(404, {"error": "not found"})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(payload, dict) or not isinstance(payload.get('queries', []), list):
+                raise ValueError("queries must be a list")
+            queries = [str(query).strip() for query in payload.get('queries', []) if str(query).strip()]
+        except ValueError:
+            self._send_json(400, {"error": "expected JSON body {\"queries\": [...]}"})
+            return
+
+        if len(queries) > service.queue_size:
+            self._send_json(413, {"error": f"batch larger than queue size ({service.queue_size})"})
+            return
+
+        self._send_json(200, {"results": service.lookup_many(queries)})
+
+    def _send_json(self, status: int, payload: Dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class LookupServer:
+    """
+    Local HTTP front end for a LookupService.
+    """
+
+    def __init__(self, lookup_service: LookupService, host: str = None, port: int = None):
+        """
+        Bind the server.
+
+        Args:
+            lookup_service: Service answering the lookups
+            host: Interface to bind
+            port: Port to bind
+        """
+        self.lookup_service = lookup_service
+        self._httpd = ThreadingHTTPServer(
+            (host or config.SERVER_HOST, config.SERVER_PORT if port is None else port),
+            _LookupHandler
+        )
+        self._httpd.daemon_threads = True
+        self._httpd.lookup_service = lookup_service
+
+    @property
+    def address(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def shutdown(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self.lookup_service.close()
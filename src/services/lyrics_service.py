@@ -1,10 +1,21 @@
 """Business logic for processing song lyrics requests."""
 
-from typing import List, Tuple
+import threading
+from typing import Dict, List, Optional, Tuple
 
 from src.clients.genius_client import GeniusAPIClient
 from src.clients.youtube_client import YouTubeAPIClient
 from src.models.song import Song
+from src.utils.circuit_breaker import CircuitBreaker
+from src.utils.latency import Deadline
+from src.utils.negative_cache import NegativeCache
+
+
+class UpstreamError(Exception):
+    """
+    Raised when Genius could not answer a lookup step (as opposed to a
+    search without hits).
+    """
 
 
 class LyricsService:
@@ -12,16 +23,29 @@ class LyricsService:
     Service for processing song search queries and fetching lyrics.
     """
     
-    def __init__(self, genius_client: GeniusAPIClient, youtube_client: YouTubeAPIClient):
+    def __init__(
+        self,
+        genius_client: GeniusAPIClient,
+        youtube_client: YouTubeAPIClient,
+        negative_cache: Optional[NegativeCache] = None,
+        retry_dead: bool = False
+    ):
         """
         Initialize the service.
         
         Args:
             genius_client: Genius API client instance
             youtube_client: YouTube API client instance
+            negative_cache: Cache of queries known to return no hits
+            retry_dead: Search known-dead queries again instead of skipping them
         """
         self.genius_client = genius_client
         self.youtube_client = youtube_client
+        self.negative_cache = negative_cache
+        self.retry_dead = retry_dead
+        # Songs whose YouTube search came back empty since the last video found
+        self._empty_streak: List[Song] = []
+        self._youtube_lock = threading.Lock()
     
     def process_search_query(self, query: str) -> Tuple[Song, bool]:
         """
@@ -33,27 +57,128 @@ class LyricsService:
         Returns:
             Tuple of (Song object or None, success boolean)
         """
-        results = self.genius_client.search(query)
+        try:
+            song = self.lookup(query)
+        except UpstreamError:
+            return None, False
+        
+        return song, song is not None
+    
+    def lookup(self, query: str) -> Optional[Song]:
+        """
+        Process a single search query, telling misses apart from failures.
+        
+        All calls made for the query share one deadline (config.QUERY_DEADLINE);
+        once it expires the remaining optional steps are skipped.
+        
+        Args:
+            query: Search query (e.g., "Obsesion Aventura")
+            
+        Returns:
+            Song object, or None if Genius has no hits for the query
+            
+        Raises:
+            UpstreamError: If the search or details request failed
+        """
+        deadline = Deadline()
+        hit = self.find_first_hit(query, deadline)
+        
+        if not hit:
+            return None
+        
+        song = self.fetch_details(hit, deadline)
+        
+        self.fetch_lyrics(song, deadline)
+        
+        # Fetch YouTube link
+        youtube_url, completed = self.fetch_youtube(song.title, song.artist, deadline)
+        self.apply_youtube(song, youtube_url, completed)
+        
+        return song
+    
+    def find_first_hit(self, query: str, deadline: Deadline) -> Optional[Dict]:
+        """
+        Search step: return the first Genius hit for a query.
+        
+        Known-dead queries are skipped and new dead queries are recorded
+        in the negative cache.
+        
+        Args:
+            query: Search query
+            deadline: Deadline shared by the query's calls
+            
+        Returns:
+            First search hit dictionary, or None if there are no hits
+            
+        Raises:
+            UpstreamError: If the search request failed
+        """
+        known_dead = self.negative_cache is not None and self.negative_cache.is_dead(query)
+        
+        if known_dead and not self.retry_dead:
+            print(f"   Skipped: no results for '{query}' on a previous run")
+            return None
+        
+        results = self.genius_client.search(query, timeout=deadline.remaining())
+        
+        if results is None:
+            print(f"   Search failed for '{query}'")
+            raise UpstreamError(f"search failed for '{query}'")
         
         if not results:
             print(f"   No results found for '{query}'")
-            return None, False
+            if self.negative_cache is not None:
+                self.negative_cache.add(query)
+            return None
+        
+        if known_dead:
+            self.negative_cache.discard(query)
         
         first_result = results[0]
         print(f"   Found: {first_result['title']} - {first_result['artist']}")
+        return first_result
+    
+    def fetch_details(self, hit: Dict, deadline: Deadline) -> Optional[Song]:
+        """
+        Details step: fetch song metadata for a search hit.
         
-        song = self.genius_client.get_song_details(first_result['id'])
+        Args:
+            hit: Search hit returned by find_first_hit
+            deadline: Deadline shared by the query's calls
+            
+        Returns:
+            Song object (without lyrics)
+            
+        Raises:
+            UpstreamError: If the details request failed or the deadline expired
+        """
+        if deadline.expired:
+            print(f"   Deadline exceeded before fetching details")
+            raise UpstreamError("deadline exceeded before fetching details")
+        
+        song = self.genius_client.get_song_details(hit['id'], timeout=deadline.remaining())
         
         if not song:
             print(f"   Could not fetch details")
-            return None, False
+            raise UpstreamError(f"could not fetch details of song {hit['id']}")
         
         print(f"    Album: {song.album}")
         print(f"    Genre(s): {song.genres}")
         print(f"    Label: {song.label}")
+        return song
+    
+    def fetch_lyrics(self, song: Song, deadline: Deadline) -> None:
+        """
+        Lyrics step: scrape the song page and set song.lyrics ("N/A" on failure).
         
+        Args:
+            song: Song returned by fetch_details
+            deadline: Deadline shared by the query's calls
+        """
         print(f"     Fetching lyrics...")
-        lyrics = self.genius_client.scrape_lyrics(song.url)
+        lyrics = ""
+        if not deadline.expired:
+            lyrics = self.genius_client.scrape_lyrics(song.url, timeout=deadline.remaining())
         
         if lyrics:
             print(f"     Lyrics obtained ({len(lyrics)} chars)")
@@ -61,20 +186,79 @@ class LyricsService:
         else:
             print(f"      Could not obtain lyrics")
             song.lyrics = "N/A"
+    
+    def fetch_youtube(self, title: str, artist: str, deadline: Deadline) -> Tuple[Optional[str], bool]:
+        """
+        YouTube step: search for the music video.
+        
+        Args:
+            title: Song title
+            artist: Artist name
+            deadline: Deadline shared by the query's calls
+            
+        Returns:
+            Tuple of (YouTube URL or None, completed boolean)
+        """
+        if deadline.expired:
+            print(f"     Deadline exceeded before searching YouTube")
+            return None, False
         
-        # Fetch YouTube link
         print(f"     Searching YouTube...")
-        youtube_url = self.youtube_client.search_music_video(song.title, song.artist)
+        return self.youtube_client.find_music_video(title, artist, timeout=deadline.remaining())
+    
+    def apply_youtube(self, song: Song, youtube_url: Optional[str], completed: bool) -> None:
+        """
+        Store a YouTube step result on the song.
+        
+        Empty results are kept until a video is found again: if the breaker
+        opens first, the empty results before it are not trusted either and
+        those songs are marked for later enrichment too.
+        """
+        breaker = self.youtube_client.breaker
+        with self._youtube_lock:
+            if youtube_url:
+                song.youtube_url = youtube_url
+                song.enrichment_pending = False
+                self._empty_streak.clear()
+            elif completed:
+                song.enrichment_pending = False
+                self._empty_streak.append(song)
+            else:
+                song.enrichment_pending = True
+                if breaker.state != CircuitBreaker.CLOSED:
+                    for earlier in self._empty_streak:
+                        earlier.enrichment_pending = True
+                    self._empty_streak.clear()
+        
         if youtube_url:
             print(f"     ✓ YouTube link found")
-            song.youtube_url = youtube_url
+        elif not completed:
+            print(f"     YouTube lookup incomplete (breaker {breaker.state}), marked for later enrichment")
+    
+    def enrich_youtube(self, songs: List[Song]) -> int:
+        """
+        Retry the YouTube lookup for songs marked for later enrichment.
         
-        return song, True
+        Args:
+            songs: Songs to enrich (updated in place)
+            
+        Returns:
+            Number of songs whose lookup completed
+        """
+        for idx, song in enumerate(songs, 1):
+            youtube_url, completed = self.youtube_client.find_music_video(song.title, song.artist)
+            self.apply_youtube(song, youtube_url, completed)
+            status = (youtube_url or 'no video') if completed else 'still unavailable'
+            print(f"[{idx}/{len(songs)}] {song.title} - {song.artist}: {status}")
+        
+        # A run of empty results can put earlier songs back to pending.
+        return sum(not song.enrichment_pending for song in songs)
     
     def process_multiple_queries(
         self,
         queries: List[str],
-        show_progress: bool = True
+        show_progress: bool = True,
+        stop: Optional[threading.Event] = None
     ) -> Tuple[List[Song], int, int]:
         """
         Process multiple search queries.
@@ -82,6 +266,8 @@ class LyricsService:
         Args:
             queries: List of search queries
             show_progress: Whether to show progress messages
+            stop: When set, stop after the current query and return the
+                songs processed so far
             
         Returns:
             Tuple of (list of Songs, successful count, failed count)
@@ -92,6 +278,10 @@ class LyricsService:
         total = len(queries)
         
         for idx, query in enumerate(queries, 1):
+            if stop is not None and stop.is_set():
+                print(f"\n  Stopped after {idx - 1}/{total} searches")
+                break
+            
             try:
                 if show_progress:
                     print(f"\n[{idx}/{total}] Searching: '{query}'...")
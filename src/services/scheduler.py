@@ -0,0 +1,231 @@
+"""Per-host request scheduler that interleaves pipeline steps across queries."""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from src.models.song import Song
+from src.services.lyrics_service import LyricsService, UpstreamError
+from src.utils.config import config
+from src.utils.latency import Deadline
+
+API_HOST = "api.genius.com"
+PAGES_HOST = "genius.com"
+YOUTUBE_HOST = "youtube.com"
+
+# Later pipeline steps go first, so queries in flight finish before new ones start.
+HOST_PRIORITY = (PAGES_HOST, YOUTUBE_HOST, API_HOST)
+
+
+class _QueryJob:
+    """
+    State of one query moving through the pipeline.
+    """
+
+    def __init__(self, index: int, query: str):
+        self.index = index
+        self.query = query
+        self.deadline = Deadline()
+        self.started = time.perf_counter()
+        self.song: Optional[Song] = None
+        self.youtube: Tuple[Optional[str], bool] = (None, False)
+        self.pending = 0
+        self.lock = threading.Lock()
+
+
+class HostScheduler:
+    """
+    Runs LyricsService steps on a shared worker pool with a concurrency cap
+    per backend host:
+        api.genius.com  search and song details
+        genius.com      lyrics page scraping
+        youtube.com     music video search
+
+    A step is queued on its host as soon as its inputs are ready, so steps of
+    different queries interleave (e.g., song A's page is scraped while song B
+    is searched) and the YouTube search starts right after the Genius search,
+    in parallel with details and lyrics. Any free worker takes the next step
+    of any host that is under its cap, so a host at its limit does not leave
+    workers idle while other hosts have work. At most `window` queries are in
+    flight, which keeps per-host queues short.
+
+    After a run, `latencies` holds each query's admission-to-completion time
+    in milliseconds, in query order.
+    """
+
+    def __init__(
+        self,
+        lyrics_service: LyricsService,
+        budgets: Optional[Dict[str, int]] = None,
+        workers: int = None,
+        window: int = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            lyrics_service: Service providing the pipeline steps
+            budgets: Concurrent requests allowed per host
+            workers: Worker threads shared by all hosts (default: sum of budgets)
+            window: Maximum number of queries in flight (default: workers)
+        """
+        self.lyrics_service = lyrics_service
+        self.budgets = dict(config.HOST_CONCURRENCY)
+        self.budgets.update(budgets or {})
+        self.workers = workers or sum(self.budgets.values())
+        self.window = window or self.workers
+        self.latencies: List[float] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def run(
+        self,
+        queries: List[str],
+        show_progress: bool = True,
+        stop: Optional[threading.Event] = None
+    ) -> Tuple[List[Song], int, int]:
+        """
+        Process multiple search queries.
+
+        Args:
+            queries: List of search queries
+            show_progress: Whether to show progress messages
+            stop: When set, admit no more queries, finish the ones in flight
+                and return the songs processed so far
+
+        Returns:
+            Tuple of (list of Songs in query order, successful count, failed count)
+        """
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="scheduler")
+        self._queues: Dict[str, deque] = {host: deque() for host in HOST_PRIORITY}
+        self._in_flight: Dict[str, int] = {host: 0 for host in HOST_PRIORITY}
+        self._running = 0
+        self._dispatch_lock = threading.Lock()
+        self._slots = threading.Semaphore(self.window)
+        self._results: List[Optional[Song]] = [None] * len(queries)
+        self.latencies = [0.0] * len(queries)
+        self._completed = 0
+        self._total = len(queries)
+        self._show_progress = show_progress
+        self._lock = threading.Lock()
+        self._all_done = threading.Event()
+
+        try:
+            admitted = 0
+            for index, query in enumerate(queries):
+                self._slots.acquire()
+                if stop is not None and stop.is_set():
+                    print(f"\n  Stopped after admitting {admitted}/{len(queries)} searches")
+                    break
+                job = _QueryJob(index, query)
+                job.pending = 1
+                self._submit(API_HOST, job, self._search)
+                admitted += 1
+
+            with self._lock:
+                self._total = admitted
+                if self._completed == self._total:
+                    self._all_done.set()
+
+            self._all_done.wait()
+
+        except KeyboardInterrupt:
+            print("\n\n  Process interrupted by user")
+
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+        songs = [song for song in self._results if song]
+        return songs, len(songs), self._total - len(songs)
+
+    def _submit(self, host: str, job: _QueryJob, step) -> None:
+        with self._dispatch_lock:
+            self._queues[host].append((job, step))
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """
+        Start queued steps while workers are free and their host is under its cap.
+        """
+        with self._dispatch_lock:
+            while self._running < self.workers:
+                host = next(
+                    (
+                        host for host in HOST_PRIORITY
+                        if self._queues[host] and self._in_flight[host] < self.budgets.get(host, self.workers)
+                    ),
+                    None
+                )
+                if host is None:
+                    return
+                job, step = self._queues[host].popleft()
+                self._in_flight[host] += 1
+                self._running += 1
+                self._executor.submit(self._execute, host, job, step)
+
+    def _execute(self, host: str, job: _QueryJob, step) -> None:
+        try:
+            step(job)
+        except Exception as e:
+            print(f"   Unexpected error for '{job.query}': {e}")
+        finally:
+            with self._dispatch_lock:
+                self._in_flight[host] -= 1
+                self._running -= 1
+            self._dispatch()
+            self._step_done(job)
+
+    def _search(self, job: _QueryJob) -> None:
+        try:
+            hit = self.lyrics_service.find_first_hit(job.query, job.deadline)
+        except UpstreamError:
+            return
+        if not hit:
+            return
+
+        with job.lock:
+            job.pending += 2
+        self._submit(API_HOST, job, lambda job: self._details(job, hit))
+        self._submit(YOUTUBE_HOST, job, lambda job: self._youtube(job, hit))
+
+    def _details(self, job: _QueryJob, hit: Dict) -> None:
+        try:
+            song = self.lyrics_service.fetch_details(hit, job.deadline)
+        except UpstreamError:
+            return
+
+        job.song = song
+        with job.lock:
+            job.pending += 1
+        self._submit(PAGES_HOST, job, self._lyrics)
+
+    def _lyrics(self, job: _QueryJob) -> None:
+        self.lyrics_service.fetch_lyrics(job.song, job.deadline)
+
+    def _youtube(self, job: _QueryJob, hit: Dict) -> None:
+        job.youtube = self.lyrics_service.fetch_youtube(hit['title'], hit['artist'], job.deadline)
+
+    def _step_done(self, job: _QueryJob) -> None:
+        with job.lock:
+            job.pending -= 1
+            if job.pending:
+                return
+
+        if job.song:
+            self.lyrics_service.apply_youtube(job.song, *job.youtube)
+            self._results[job.index] = job.song
+        self.latencies[job.index] = (time.perf_counter() - job.started) * 1000
+
+        with self._lock:
+            self._completed += 1
+            completed = self._completed
+            finished = completed == self._total
+
+        if self._show_progress:
+            status = "done" if job.song else "failed"
+            print(f"\n[{completed}/{self._total}] {status}: '{job.query}'")
+
+        self._slots.release()
+        if finished:
+            self._all_done.set()
@@ -0,0 +1,103 @@
+"""Parallel processing of searches.txt sections as independent partitions."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Tuple
+
+from src.models.song import Song
+from src.utils.config import config
+
+ProcessFn = Callable[[List[str], threading.Event], Tuple[List[Song], int, int]]
+CompleteFn = Callable[[str, List[Song]], None]
+
+
+class SectionProcessor:
+    """
+    Runs each section of the searches file (e.g., BACHATA, MERENGUE) as its
+    own partition.
+
+    Sections are processed in parallel and do not wait for each other: as
+    soon as one finishes, its songs are tagged with the section name and
+    handed to `on_complete` (e.g., to upsert them into the catalog and, if
+    asked, write that section's own file). `on_complete` calls run one at a
+    time, so their writes do not interleave.
+
+    On Ctrl-C, sections that have not started are cancelled and running
+    ones stop after their current query; the songs they processed so far
+    are still handed to `on_complete`.
+    """
+
+    def __init__(self, process: ProcessFn, on_complete: CompleteFn, workers: int = None):
+        """
+        Initialize the processor.
+
+        Args:
+            process: Processes a list of queries, stopping early once the
+                given event is set, and returns (songs, successful count,
+                failed count)
+            on_complete: Called with (section, songs) when a section finishes
+            workers: Sections processed at the same time
+        """
+        self.process = process
+        self.on_complete = on_complete
+        self.workers = workers or config.SECTION_WORKERS
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def run(self, sections: Dict[str, List[str]]) -> Tuple[List[Song], int, int]:
+        """
+        Process every section.
+
+        Args:
+            sections: Mapping of section name to its queries
+
+        Returns:
+            Tuple of (list of Songs, successful count, failed count)
+        """
+        songs: List[Song] = []
+        successful = 0
+        failed = 0
+
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(sections))))
+        futures = {
+            executor.submit(self._run_section, name, queries): name
+            for name, queries in sections.items()
+        }
+        try:
+            wait(futures)
+        except KeyboardInterrupt:
+            print("\n\n  Process interrupted by user, saving the sections processed so far...")
+            self._stop.set()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # Running sections return (and flush) what they have after the stop.
+        for future, name in futures.items():
+            if future.cancelled():
+                continue
+            try:
+                section_songs, section_ok, section_failed = future.result()
+            except Exception as e:
+                print(f"\n Section {name} failed: {e}")
+                failed += len(sections[name])
+                continue
+
+            songs.extend(section_songs)
+            successful += section_ok
+            failed += section_failed
+
+        return songs, successful, failed
+
+    def _run_section(self, name: str, queries: List[str]) -> Tuple[List[Song], int, int]:
+        print(f"\n[{name}] Processing {len(queries)} searches...")
+        songs, successful, failed = self.process(queries, self._stop)
+
+        for song in songs:
+            song.section = name
+
+        with self._flush_lock:
+            self.on_complete(name, songs)
+
+        status = "Stopped" if self._stop.is_set() else "Done"
+        print(f"\n[{name}] {status}: {successful} successful, {failed} failed")
+        return songs, successful, failed
@@ -2,5 +2,10 @@
 
 from .config import config, Config
 from .file_handler import FileHandler
+from .song_store import SongStore
+from .negative_cache import NegativeCache
+from .circuit_breaker import CircuitBreaker
+from .lyrics_parser import LyricsParser, extract_lyrics
+from .lyrics_archive import LyricsArchive
 
-__all__ = ['config', 'Config', 'FileHandler']
+__all__ = ['config', 'Config', 'FileHandler', 'SongStore', 'NegativeCache', 'CircuitBreaker', 'LyricsParser', 'extract_lyrics', 'LyricsArchive']
@@ -0,0 +1,154 @@
+"""Circuit breaker and health tracking for flaky backends."""
+
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional
+
+
+class CircuitBreaker:
+    """
+    Stops calling a backend after consecutive failures.
+
+    closed    -> calls go through; `failure_threshold` consecutive failures (or
+                 `empty_threshold` consecutive empty answers) open it
+    open      -> calls are rejected until `cooldown` seconds have passed
+    half_open -> one trial call is let through; success closes, failure re-opens
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        cooldown: float,
+        empty_threshold: Optional[int] = None
+    ):
+        """
+        Initialize the breaker in the closed state.
+
+        Args:
+            name: Backend name used in reports
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown: Seconds to stay open before a half-open trial
+            empty_threshold: Consecutive empty answers that open the circuit
+                (None to never open on empty answers)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.empty_threshold = empty_threshold
+        self.successes = 0
+        self.empty = 0
+        self.rejected = 0
+        self.trips = 0
+        self.failures: Counter = Counter()
+        self._state = self.CLOSED
+        self._consecutive = 0
+        self._consecutive_empty = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may go through now.
+
+        Returns:
+            True if the call should be attempted, False if it is rejected
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+
+            self.rejected += 1
+            return False
+
+    def record_success(self, empty: bool = False) -> bool:
+        """
+        Record a call that got an answer.
+
+        Args:
+            empty: The answer had no results. Empty answers are counted apart,
+                and a run of `empty_threshold` of them (e.g., after blocking
+                or a markup change) opens the circuit.
+
+        Returns:
+            False if the answer was empty and the run of empty answers is too
+            long to trust it; the circuit is then open
+        """
+        with self._lock:
+            self.successes += 1
+            self._consecutive = 0
+            if empty:
+                self.empty += 1
+                self._consecutive_empty += 1
+                if self.empty_threshold and self._consecutive_empty >= self.empty_threshold:
+                    self._open()
+                    return False
+            else:
+                self._consecutive_empty = 0
+            self._state = self.CLOSED
+            self._probe_in_flight = False
+            return True
+
+    def record_failure(self, reason: str) -> None:
+        """
+        Record a failed call.
+
+        Args:
+            reason: Short failure reason (e.g., 'timeout', 'ConnectionError')
+        """
+        with self._lock:
+            self.failures[reason] += 1
+            self._consecutive += 1
+            if self._state == self.HALF_OPEN or self._consecutive >= self.failure_threshold:
+                self._open()
+
+    def _open(self) -> None:
+        # Caller holds the lock.
+        if self._state != self.OPEN:
+            self.trips += 1
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "state": self._state,
+                "successes": self.successes,
+                "empty": self.empty,
+                "failures": dict(self.failures),
+                "rejected": self.rejected,
+                "trips": self.trips,
+            }
+
+    def summary(self) -> str:
+        """
+        One-line health report for console output.
+        """
+        snapshot = self.snapshot()
+        reasons = ", ".join(f"{reason}: {count}" for reason, count in snapshot["failures"].items())
+        return (
+            f"{self.name}: {snapshot['successes']} ok ({snapshot['empty']} without results), "
+            f"{sum(snapshot['failures'].values())} failed ({reasons or 'none'}), "
+            f"{snapshot['rejected']} skipped while open, {snapshot['trips']} trips, "
+            f"state {snapshot['state']}"
+        )
@@ -2,6 +2,7 @@
 
 import os
 from pathlib import Path
+from typing import Dict
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -14,17 +15,71 @@ class Config:
     """
     
     GENIUS_ACCESS_TOKEN: str = os.getenv("GENIUS_ACCESS_TOKEN", "")
-    GENIUS_BASE_URL: str = "https://api.genius.com"
+    GENIUS_BASE_URL: str = os.getenv("GENIUS_BASE_URL", "https://api.genius.com")
     
     API_TIMEOUT: int = 20
     SCRAPING_TIMEOUT: int = 20
+    HTTP_POOL_SIZE: int = 32
+    
+    # Processes parsing lyrics pages off the fetching threads (0 parses in-thread);
+    # defaults to one per core, leaving one core for the fetching threads
+    PARSER_WORKERS: int = int(os.getenv("PARSER_WORKERS", str(min(4, (os.cpu_count() or 1) - 1))))
+    
+    # Concurrent requests per backend host when using the host scheduler
+    HOST_CONCURRENCY: Dict[str, int] = {
+        "api.genius.com": 8,
+        "genius.com": 8,
+        "youtube.com": 4,
+    }
+    YOUTUBE_TIMEOUT: int = 20
+    
+    # YouTube circuit breaker: stop scraping after consecutive failures, or after
+    # consecutive searches without results (blocking, markup changes)
+    YOUTUBE_FAILURE_THRESHOLD: int = 5
+    YOUTUBE_EMPTY_THRESHOLD: int = 10
+    YOUTUBE_COOLDOWN: float = 120
+    
+    # Adaptive timeouts derived from observed per-endpoint latency
+    ADAPTIVE_TIMEOUTS: bool = os.getenv("ADAPTIVE_TIMEOUTS", "1") == "1"
+    TIMEOUT_PERCENTILE: float = 99
+    TIMEOUT_MULTIPLIER: float = 3.0
+    MIN_TIMEOUT: float = 2.0
+    LATENCY_WINDOW: int = 200
+    LATENCY_MIN_SAMPLES: int = 20
+    
+    # Budget for all calls made for one query (search, details, lyrics, YouTube)
+    QUERY_DEADLINE: float = float(os.getenv("QUERY_DEADLINE", "60"))
+    
+    # Hedged requests: send a duplicate after the p95 delay, first response wins
+    HEDGE_REQUESTS: bool = os.getenv("HEDGE_REQUESTS", "0") == "1"
+    HEDGE_PERCENTILE: float = 95
     
     PROJECT_ROOT: Path = Path(__file__).parent.parent.parent
     SEARCHES_FILE: str = "searches.txt"
     OUTPUT_FILE: str = "dominican_songs.xlsx"
+    STORE_FILE: str = os.getenv("LYRICS_STORE_FILE", "songs.db")
+    ANALYTICS_FILE: str = "lyrics_analytics.xlsx"
+    
+    # Lyrics archive (.lyra): zstd with a dictionary trained on the catalog
+    ARCHIVE_DICT_SIZE: int = 112 * 1024
+    ARCHIVE_LEVEL: int = 19
     
     RESULTS_PER_PAGE: int = 1
     
+    # searches.txt sections (`# BACHATA` headers), processed in parallel
+    DEFAULT_SECTION: str = "Canciones"
+    SECTION_WORKERS: int = 4
+    
+    NEGATIVE_CACHE_TTL_DAYS: float = float(os.getenv("NEGATIVE_CACHE_TTL_DAYS", "30"))
+    
+    # Lookup server (main.py serve)
+    SERVER_HOST: str = os.getenv("LYRICS_SERVER_HOST", "127.0.0.1")
+    SERVER_PORT: int = int(os.getenv("LYRICS_SERVER_PORT", "8765"))
+    SERVER_WORKERS: int = 16
+    SERVER_QUEUE_SIZE: int = 256
+    LOOKUP_CACHE_SIZE: int = 10000
+    LOOKUP_CACHE_TTL: float = 24 * 3600
+    
     @classmethod
     def validate(cls) -> bool:
         """
@@ -1,11 +1,14 @@
 """File handling utilities for reading searches and writing results."""
 
 import os
-from typing import List, Optional
+import re
+from typing import Dict, List, Optional
 import pandas as pd
 from openpyxl.styles import Alignment
 
 from ..models.song import Song
+from .config import config
+from .lyrics_archive import LyricsArchive
 
 
 class FileHandler:
@@ -41,6 +44,69 @@ class FileHandler:
             print(f" Error reading {filename}: {e}")
             return None
     
+    @staticmethod
+    def load_search_sections(filename: str) -> Optional[Dict[str, List[str]]]:
+        """
+        Load search queries grouped by their `# SECTION` header.
+        
+        Queries above the first header go to config.DEFAULT_SECTION, and
+        repeated headers add to the same section.
+        
+        Args:
+            filename: Path to the searches file
+            
+        Returns:
+            Dict mapping section name to its queries (in file order) or
+            None if file not found
+        """
+        try:
+            if not os.path.exists(filename):
+                return None
+            
+            sections: Dict[str, List[str]] = {}
+            section = config.DEFAULT_SECTION
+            
+            with open(filename, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line.startswith('#'):
+                        section = line.lstrip('#').strip() or config.DEFAULT_SECTION
+                    elif line:
+                        sections.setdefault(section, []).append(line)
+            
+            return sections if sections else None
+            
+        except Exception as e:
+            print(f" Error reading {filename}: {e}")
+            return None
+    
+    @staticmethod
+    def _write_songs_sheet(writer: pd.ExcelWriter, songs: List[Song], sheet_name: str) -> None:
+        data = [song.to_dict() for song in songs]
+        
+        df = pd.DataFrame(data, columns=list(Song.EXPORT_COLUMNS))
+        
+        df.to_excel(writer, index=False, sheet_name=sheet_name)
+        
+        worksheet = writer.sheets[sheet_name]
+        
+        column_widths = {
+            'A': 20,  # genero
+            'B': 25,  # artista
+            'C': 30,  # cancion
+            'D': 80,  # letras
+            'E': 50,  # enlace_genius
+            'F': 50,  # enlace_youtube
+            'G': 25,  # discografica
+        }
+        
+        for col, width in column_widths.items():
+            worksheet.column_dimensions[col].width = width
+        
+        for row in range(2, len(songs) + 2):
+            cell = worksheet.cell(row=row, column=4)  # Column D (lyrics)
+            cell.alignment = Alignment(wrap_text=True, vertical='top')
+    
     @staticmethod
     def save_to_excel(songs: List[Song], filename: str) -> bool:
         """
@@ -54,33 +120,8 @@ class FileHandler:
             True if successful, False otherwise
         """
         try:
-            data = [song.to_dict() for song in songs]
-            
-            df = pd.DataFrame(data)
-            
-            df = df[['genero', 'artista', 'cancion', 'letras', 'enlace_genius', 'enlace_youtube', 'discografica']]
-            
             with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Canciones')
-                
-                worksheet = writer.sheets['Canciones']
-                
-                column_widths = {
-                    'A': 20,  # genero
-                    'B': 25,  # artista
-                    'C': 30,  # cancion
-                    'D': 80,  # letras
-                    'E': 50,  # enlace_genius
-                    'F': 50,  # enlace_youtube
-                    'G': 25,  # discografica
-                }
-                
-                for col, width in column_widths.items():
-                    worksheet.column_dimensions[col].width = width
-                
-                for row in range(2, len(songs) + 2):
-                    cell = worksheet.cell(row=row, column=4)  # Column D (lyrics)
-                    cell.alignment = Alignment(wrap_text=True, vertical='top')
+                FileHandler._write_songs_sheet(writer, songs, 'Canciones')
             
             print(f" Excel saved successfully: {filename}")
             return True
@@ -112,3 +153,131 @@ class FileHandler:
         except Exception as e:
             print(f" Error saving CSV: {e}")
             return False
+    
+    @staticmethod
+    def save_to_archive(songs: List[Song], filename: str) -> bool:
+        """
+        Save songs to a compressed lyrics archive (.lyra) that can be read
+        one song at a time with LyricsArchive.
+        
+        Args:
+            songs: List of Song objects
+            filename: Output filename
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            stats = LyricsArchive.write(songs, filename)
+            ratio = stats['raw_bytes'] / stats['archive_bytes'] if stats['archive_bytes'] else 0
+            
+            print(f" Archive saved successfully: {filename}")
+            print(f"    {stats['songs']} songs, {stats['archive_bytes'] / 1024:.1f} KB "
+                  f"({ratio:.1f}x smaller than the raw text, dictionary {stats['dict_bytes'] / 1024:.1f} KB)")
+            return True
+            
+        except Exception as e:
+            print(f" Error saving archive: {e}")
+            return False
+    
+    @staticmethod
+    def section_filename(filename: str, section: str) -> str:
+        """
+        Filename of one section's file (e.g., 'songs.xlsx' -> 'songs_bachata.xlsx').
+        """
+        base, ext = os.path.splitext(filename)
+        slug = re.sub(r'\W+', '_', section.lower()).strip('_') or 'section'
+        return f"{base}_{slug}{ext}"
+    
+    @staticmethod
+    def save_section(songs: List[Song], section: str, filename: str) -> bool:
+        """
+        Write one section to its own file, so saving it costs only the size
+        of that section.
+        
+        Args:
+            songs: Songs of the section
+            section: Section name (e.g., 'BACHATA')
+            filename: Output filename (.xlsx or .csv); the section name is
+                appended to it
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        section_file = FileHandler.section_filename(filename, section)
+        try:
+            if filename.lower().endswith('.csv'):
+                df = pd.DataFrame([song.to_dict() for song in songs], columns=list(Song.EXPORT_COLUMNS))
+                df.to_csv(section_file, index=False, encoding='utf-8')
+            else:
+                with pd.ExcelWriter(section_file, engine='openpyxl') as writer:
+                    FileHandler._write_songs_sheet(writer, songs, FileHandler._sheet_name(section))
+            
+            print(f" Section '{section}' saved successfully: {section_file}")
+            return True
+            
+        except Exception as e:
+            print(f" Error saving section '{section}': {e}")
+            return False
+    
+    @staticmethod
+    def save_sections(sections: Dict[str, List[Song]], filename: str) -> bool:
+        """
+        Write every section in one pass: one sheet each for .xlsx, one file
+        each (section name appended to the filename) for .csv.
+        
+        Args:
+            sections: Mapping of section name to its songs
+            filename: Output filename (.xlsx or .csv)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if filename.lower().endswith('.csv'):
+            return all([FileHandler.save_section(songs, name, filename) for name, songs in sections.items()])
+        
+        try:
+            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+                for name, songs in sections.items():
+                    FileHandler._write_songs_sheet(writer, songs, FileHandler._sheet_name(name))
+            
+            print(f" Excel saved successfully: {filename} ({len(sections)} sheets)")
+            return True
+            
+        except Exception as e:
+            print(f" Error saving Excel: {e}")
+            return False
+    
+    @staticmethod
+    def _sheet_name(section: str) -> str:
+        return re.sub(r'[\[\]:*?/\\]', ' ', section)[:31]
+    
+    @staticmethod
+    def save_tables(tables: Dict[str, pd.DataFrame], filename: str) -> bool:
+        """
+        Save several tables, one sheet each (or one CSV each with the
+        table name appended to the filename).
+        
+        Args:
+            tables: Mapping of sheet name to DataFrame
+            filename: Output filename (.xlsx or .csv)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if filename.lower().endswith('.csv'):
+                base = filename[:-4]
+                for name, df in tables.items():
+                    df.to_csv(f"{base}_{name}.csv", index=False, encoding='utf-8')
+            else:
+                with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+                    for name, df in tables.items():
+                        df.to_excel(writer, index=False, sheet_name=name[:31])
+            
+            print(f" Tables saved successfully: {filename}")
+            return True
+            
+        except Exception as e:
+            print(f" Error saving tables: {e}")
+            return False
@@ -0,0 +1,122 @@
+"""Latency tracking for adaptive timeouts, hedged requests and per-query deadlines."""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from .config import config
+
+
+class LatencyTracker:
+    """
+    Keeps a sliding window of observed latencies per endpoint and derives
+    timeouts and hedge delays from their percentiles.
+    """
+
+    def __init__(self, window: int = None, min_samples: int = None):
+        """
+        Initialize the tracker.
+
+        Args:
+            window: Number of recent samples kept per endpoint
+            min_samples: Samples required before percentiles are trusted
+        """
+        self.window = window or config.LATENCY_WINDOW
+        self.min_samples = min_samples or config.LATENCY_MIN_SAMPLES
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, endpoint: str, percentile: float) -> Optional[float]:
+        """
+        Get a latency percentile for an endpoint.
+
+        Args:
+            endpoint: Endpoint name (e.g., 'search')
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Latency in seconds, or None until enough samples were observed
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+        if len(samples) < self.min_samples:
+            return None
+        index = min(len(samples) - 1, int(round(percentile / 100 * (len(samples) - 1))))
+        return samples[index]
+
+    def timeout_for(self, endpoint: str, default: float) -> float:
+        """
+        Get the timeout to use for the next request to an endpoint.
+
+        The adaptive value is a multiple of the observed tail latency, never
+        below MIN_TIMEOUT and never above the configured fixed timeout.
+
+        Args:
+            endpoint: Endpoint name
+            default: Fixed timeout used until enough samples exist
+
+        Returns:
+            Timeout in seconds
+        """
+        if not config.ADAPTIVE_TIMEOUTS:
+            return default
+        tail = self.percentile(endpoint, config.TIMEOUT_PERCENTILE)
+        if tail is None:
+            return default
+        return min(default, max(config.MIN_TIMEOUT, tail * config.TIMEOUT_MULTIPLIER))
+
+    def hedge_delay(self, endpoint: str) -> Optional[float]:
+        """
+        Get how long to wait before sending a hedged duplicate request.
+
+        Returns:
+            Delay in seconds, or None if hedging is disabled or not yet calibrated
+        """
+        if not config.HEDGE_REQUESTS:
+            return None
+        return self.percentile(endpoint, config.HEDGE_PERCENTILE)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get p50/p95/p99 (in milliseconds) for every tracked endpoint.
+        """
+        with self._lock:
+            endpoints = list(self._samples)
+        return {
+            endpoint: {
+                f"p{p}": round((self.percentile(endpoint, p) or 0.0) * 1000, 1)
+                for p in (50, 95, 99)
+            }
+            for endpoint in endpoints
+        }
+
+
+class Deadline:
+    """
+    Overall time budget shared by every call made for one query.
+    """
+
+    def __init__(self, seconds: float = None):
+        """
+        Start the deadline clock.
+
+        Args:
+            seconds: Budget in seconds (defaults to config.QUERY_DEADLINE)
+        """
+        self.seconds = seconds or config.QUERY_DEADLINE
+        self._expires_at = time.monotonic() + self.seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self._expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
@@ -0,0 +1,207 @@
+"""Compressed lyrics archive with memory-mapped random access by song ID."""
+
+import dataclasses
+import json
+import mmap
+import struct
+import threading
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import zstandard
+
+from ..models.song import Song
+from .config import config
+
+
+class LyricsArchive:
+    """
+    Read-only archive of songs, each compressed on its own with a zstd
+    dictionary trained on the whole catalog.
+
+    Lyrics are short and share most of their vocabulary and structure, so a
+    shared dictionary compresses them far better than compressing each song
+    alone, while still letting one song be decompressed without the others.
+
+    Layout (little-endian):
+        header      magic, version, song count, dictionary size, index offset
+        dictionary  trained zstd dictionary (empty if the catalog was too small)
+        records     one zstd frame per song: the song's fields as JSON
+        index       song IDs (int64, sorted), then record offsets (uint64,
+                    one more than songs; song i is offsets[i]:offsets[i + 1])
+
+    The file is memory-mapped and the index is searched in place with
+    numpy.searchsorted, so a lookup only touches the pages it reads.
+    """
+
+    MAGIC = b"LYRA"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHHIQQ")
+    EXTENSION = ".lyra"
+
+    def __init__(self, path: str):
+        """
+        Open an archive for reading.
+
+        Args:
+            path: Path to the archive file
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        magic, version, _, count, dict_size, index_offset = self.HEADER.unpack_from(self._map, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a lyrics archive (version {self.VERSION})")
+
+        dict_start = self.HEADER.size
+        self._dictionary = (
+            zstandard.ZstdCompressionDict(self._map[dict_start:dict_start + dict_size])
+            if dict_size else None
+        )
+        self._ids = np.frombuffer(self._map, dtype="<i8", count=count, offset=index_offset)
+        self._offsets = np.frombuffer(
+            self._map, dtype="<u8", count=count + 1, offset=index_offset + 8 * count
+        )
+        self._local = threading.local()
+
+    @classmethod
+    def write(cls, songs: List[Song], path: str, dict_size: int = None, level: int = None) -> Dict:
+        """
+        Build an archive from songs (songs without a song_id are skipped;
+        for repeated IDs the last song wins).
+
+        Args:
+            songs: Songs to store
+            path: Output path
+            dict_size: Maximum dictionary size in bytes
+            level: zstd compression level
+
+        Returns:
+            Dict with 'songs', 'raw_bytes', 'dict_bytes' and 'archive_bytes'
+        """
+        dict_size = dict_size or config.ARCHIVE_DICT_SIZE
+        level = level or config.ARCHIVE_LEVEL
+
+        by_id = {int(song.song_id): song for song in songs if song.song_id is not None}
+        ids = np.array(sorted(by_id), dtype="<i8")
+        records = [cls._encode(by_id[song_id]) for song_id in ids.tolist()]
+
+        dictionary = cls._train_dictionary(records, dict_size)
+        compressor = zstandard.ZstdCompressor(
+            level=level, dict_data=dictionary, write_content_size=True,
+            write_checksum=False, write_dict_id=False
+        )
+        frames = [compressor.compress(record) for record in records]
+        dict_bytes = dictionary.as_bytes() if dictionary else b""
+
+        offsets = np.zeros(len(frames) + 1, dtype="<u8")
+        np.cumsum([len(frame) for frame in frames], out=offsets[1:])
+        offsets += cls.HEADER.size + len(dict_bytes)
+        index_offset = int(offsets[-1])
+        # int64 index entries are read in place, so keep them 8-byte aligned
+        padding = -index_offset % 8
+        index_offset += padding
+
+        with open(path, "wb") as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, 0, len(ids), len(dict_bytes), index_offset))
+            f.write(dict_bytes)
+            for frame in frames:
+                f.write(frame)
+            f.write(b"\0" * padding)
+            f.write(ids.tobytes())
+            f.write(offsets.tobytes())
+            archive_bytes = f.tell()
+
+        return {
+            'songs': len(ids),
+            'raw_bytes': sum(len(record) for record in records),
+            'dict_bytes': len(dict_bytes),
+            'archive_bytes': archive_bytes,
+        }
+
+    @staticmethod
+    def _encode(song: Song) -> bytes:
+        fields = dataclasses.asdict(song)
+        del fields['song_id']
+        return json.dumps(fields, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    @staticmethod
+    def _train_dictionary(records: List[bytes], dict_size: int) -> Optional[zstandard.ZstdCompressionDict]:
+        # zstd needs a reasonable number of samples, and a dictionary larger
+        # than a fraction of the corpus only adds size.
+        total = sum(len(record) for record in records)
+        if len(records) < 8:
+            return None
+        try:
+            return zstandard.train_dictionary(min(dict_size, max(1024, total // 10)), records)
+        except zstandard.ZstdError:
+            return None
+
+    def _decompressor(self) -> zstandard.ZstdDecompressor:
+        # Decompressors are not thread-safe; keep one per thread.
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            decompressor = zstandard.ZstdDecompressor(dict_data=self._dictionary)
+            self._local.decompressor = decompressor
+        return decompressor
+
+    def _position(self, song_id: int) -> int:
+        index = int(np.searchsorted(self._ids, song_id))
+        if index < len(self._ids) and self._ids[index] == song_id:
+            return index
+        return -1
+
+    def _read(self, index: int) -> Song:
+        start, end = int(self._offsets[index]), int(self._offsets[index + 1])
+        fields = json.loads(self._decompressor().decompress(self._map[start:end]))
+        return Song(song_id=int(self._ids[index]), **fields)
+
+    def get(self, song_id: int) -> Optional[Song]:
+        """
+        Read one song.
+
+        Args:
+            song_id: Genius song ID
+
+        Returns:
+            Song object or None if the archive does not contain it
+        """
+        index = self._position(int(song_id))
+        return self._read(index) if index >= 0 else None
+
+    def song_ids(self) -> np.ndarray:
+        """
+        Sorted song IDs in the archive.
+
+        Returns:
+            A copy of the index, so it stays valid after close()
+        """
+        return self._ids.copy()
+
+    def __contains__(self, song_id: int) -> bool:
+        return self._position(int(song_id)) >= 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[Song]:
+        for index in range(len(self._ids)):
+            yield self._read(index)
+
+    def close(self) -> None:
+        # Drop the numpy views first: an mmap with exported buffers cannot close.
+        self._ids = self._offsets = None
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "LyricsArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
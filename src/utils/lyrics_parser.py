@@ -0,0 +1,134 @@
+"""Lyrics extraction from Genius song pages, optionally on worker processes."""
+
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from .config import config
+
+# Only the lyrics containers are turned into a tree; the rest of the page is skipped.
+LYRICS_CONTAINERS = SoupStrainer('div', attrs={'data-lyrics-container': 'true'})
+SECTION_MARKERS = re.compile(r'[\(\[].*?[\)\]]')
+
+
+def extract_lyrics(html: bytes, encoding: Optional[str] = None) -> Optional[str]:
+    """
+    Extract and clean the lyrics of a Genius song page.
+
+    Module-level so it can run in a worker process: the raw page bytes go in
+    and only the lyrics text comes back.
+
+    Args:
+        html: Raw page body
+        encoding: Page encoding from the response headers (None to detect)
+
+    Returns:
+        Cleaned lyrics text, or None if the page has no lyrics containers
+    """
+    soup = BeautifulSoup(html, 'html.parser', parse_only=LYRICS_CONTAINERS, from_encoding=encoding)
+    lyrics_divs = soup.find_all('div', attrs={'data-lyrics-container': 'true'})
+
+    if not lyrics_divs:
+        return None
+
+    lyrics = '\n'.join([div.get_text(separator="\n") for div in lyrics_divs])
+    lyrics = SECTION_MARKERS.sub('', lyrics)  # Remove [Verse], [Chorus], etc.
+    return os.linesep.join([line for line in lyrics.splitlines() if line.strip()])
+
+
+class LyricsParser:
+    """
+    Runs extract_lyrics on a pool of worker processes so HTML parsing does
+    not hold the GIL of the threads fetching pages.
+
+    With 0 workers pages are parsed in the calling thread.
+    """
+
+    _shared: Optional["LyricsParser"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Initialize the parser. The worker processes start on the first
+        parse, so commands that never fetch a page do not spawn them.
+
+        Args:
+            workers: Worker processes (default: config.PARSER_WORKERS)
+        """
+        self.workers = config.PARSER_WORKERS if workers is None else workers
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # spawn: workers must not inherit the parent's threads and sockets
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        # Start every worker now rather than one per queued page.
+        for _ in range(self.workers):
+            executor.submit(extract_lyrics, b"")
+        return executor
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._create_executor()
+            return self._executor
+
+    def _replace_broken(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        with self._lock:
+            # Several threads can see the same broken pool; replace it once.
+            if self._executor is broken:
+                print(" Lyrics parser worker died, restarting the parser pool")
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._create_executor()
+            return self._executor
+
+    @classmethod
+    def shared(cls) -> "LyricsParser":
+        """
+        Process-wide parser, so every client shares one pool of workers.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def parse(self, html: bytes, encoding: Optional[str] = None) -> Optional[str]:
+        """
+        Extract the lyrics of one page, blocking until the result is ready.
+
+        Each fetching thread waits on its own task, so results always reach
+        the request that fetched the page.
+
+        Args:
+            html: Raw page body
+            encoding: Page encoding from the response headers
+
+        Returns:
+            Cleaned lyrics text, or None if the page has no lyrics containers
+        """
+        if self.workers <= 0:
+            return extract_lyrics(html, encoding)
+
+        executor = self._get_executor()
+        try:
+            return executor.submit(extract_lyrics, html, encoding).result()
+        except BrokenProcessPool:
+            # A worker died (e.g., out of memory). Retry once on a new pool;
+            # the page itself may be the cause, so not in this process.
+            executor = self._replace_broken(executor)
+            return executor.submit(extract_lyrics, html, encoding).result()
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,160 @@
+"""Persistent cache of search queries that returned no hits."""
+
+import hashlib
+import math
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a query so trivial case and spacing differences share one entry.
+    """
+    return " ".join(query.casefold().split())
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings (no false negatives).
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Size the filter for an expected number of items.
+
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false-positive rate
+        """
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class NegativeCache:
+    """
+    Remembers queries that returned no search hits so later runs can skip them.
+
+    Entries live in a SQLite table and expire after `ttl_days`. Small lists are
+    held in memory as an exact map; past `bloom_threshold` entries a Bloom filter
+    is kept in memory instead and positives are confirmed against the table.
+    """
+
+    def __init__(self, path: str, ttl_days: float = 30, bloom_threshold: int = 100_000):
+        """
+        Open (or create) the negative cache.
+
+        Args:
+            path: Path to the SQLite file (may be shared with SongStore)
+            ttl_days: Days before a dead query is searched again
+            bloom_threshold: Entry count above which the Bloom filter is used
+        """
+        self.ttl = ttl_days * 86400
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS negative_queries (
+                    query TEXT PRIMARY KEY,
+                    checked_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "DELETE FROM negative_queries WHERE checked_at < ?",
+                (time.time() - self.ttl,)
+            )
+
+        count = self._conn.execute("SELECT COUNT(*) FROM negative_queries").fetchone()[0]
+        self._exact: Optional[Dict[str, float]] = None
+        self._bloom: Optional[BloomFilter] = None
+        if count > bloom_threshold:
+            # Stream the queries into the filter instead of loading them all.
+            self._bloom = BloomFilter(count * 2)
+            for (query,) in self._conn.execute("SELECT query FROM negative_queries"):
+                self._bloom.add(query)
+        else:
+            self._exact = dict(self._conn.execute("SELECT query, checked_at FROM negative_queries"))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM negative_queries").fetchone()[0]
+
+    def is_dead(self, query: str) -> bool:
+        """
+        Check whether a query is known to return no hits.
+
+        Args:
+            query: Search query
+
+        Returns:
+            True if the query returned no hits within the expiry window
+        """
+        key = normalize_query(query)
+
+        if self._exact is not None:
+            checked_at = self._exact.get(key)
+        elif key not in self._bloom:
+            return False
+        else:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT checked_at FROM negative_queries WHERE query = ?", (key,)
+                ).fetchone()
+            checked_at = row[0] if row else None
+
+        return checked_at is not None and checked_at >= time.time() - self.ttl
+
+    def add(self, query: str) -> None:
+        """
+        Record a query that returned no hits.
+
+        Args:
+            query: Search query
+        """
+        key = normalize_query(query)
+        checked_at = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO negative_queries (query, checked_at) VALUES (?, ?)",
+                (key, checked_at)
+            )
+        if self._exact is not None:
+            self._exact[key] = checked_at
+        else:
+            self._bloom.add(key)
+
+    def discard(self, query: str) -> None:
+        """
+        Forget a query (e.g., after a forced retry found hits).
+
+        Args:
+            query: Search query
+        """
+        key = normalize_query(query)
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM negative_queries WHERE query = ?", (key,))
+        if self._exact is not None:
+            self._exact.pop(key, None)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,239 @@
+"""Persistent SQLite song catalog keyed by Genius song ID."""
+
+import sqlite3
+import threading
+from typing import Iterable, List, Optional
+
+from ..models.song import Song
+from .config import config
+from .file_handler import FileHandler
+from .lyrics_archive import LyricsArchive
+
+
+class SongStore:
+    """
+    Canonical song catalog. Results are upserted into it and exports are
+    generated from it, so a run only touches the songs it processed.
+    """
+
+    COLUMNS = [
+        'song_id', 'title', 'artist', 'url', 'genres', 'label',
+        'album', 'release_date', 'lyrics', 'youtube_url', 'enrichment_pending', 'section'
+    ]
+
+    KEEP_EXISTING = ('lyrics', 'youtube_url')
+    
+    # Columns added after the first release, created on older databases
+    MIGRATIONS = {
+        'enrichment_pending': "INTEGER NOT NULL DEFAULT 0",
+        'section': "TEXT",
+    }
+
+    def __init__(self, path: str, batch_size: int = 500):
+        """
+        Open (or create) the catalog database.
+
+        Args:
+            path: Path to the SQLite file
+            batch_size: Songs written per transaction by upsert_songs
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS songs (
+                    song_id INTEGER PRIMARY KEY,
+                    title TEXT,
+                    artist TEXT,
+                    url TEXT,
+                    genres TEXT,
+                    label TEXT,
+                    album TEXT,
+                    release_date TEXT,
+                    lyrics TEXT,
+                    youtube_url TEXT,
+                    enrichment_pending INTEGER NOT NULL DEFAULT 0,
+                    section TEXT,
+                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+                """
+            )
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(songs)")}
+            for column, definition in self.MIGRATIONS.items():
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE songs ADD COLUMN {column} {definition}")
+
+    def upsert_songs(self, songs: Iterable[Song]) -> int:
+        """
+        Insert new songs and update existing ones, batching writes in transactions.
+
+        A failed lyrics or YouTube lookup ("N/A") does not overwrite a value
+        stored by an earlier run, and songs without a section keep the
+        stored one.
+
+        Args:
+            songs: Songs to write (songs without a song_id are skipped)
+
+        Returns:
+            Number of songs written
+        """
+        placeholders = ", ".join("?" for _ in self.COLUMNS)
+        updates = ", ".join(
+            f"{col} = CASE WHEN excluded.{col} = 'N/A' THEN songs.{col} ELSE excluded.{col} END"
+            if col in self.KEEP_EXISTING else
+            f"{col} = excluded.{col}"
+            for col in self.COLUMNS[1:]
+            if col not in ('enrichment_pending', 'section')
+        )
+        updates += (
+            ", enrichment_pending = CASE WHEN songs.youtube_url != 'N/A' "
+            "THEN 0 ELSE excluded.enrichment_pending END"
+            ", section = COALESCE(excluded.section, songs.section)"
+        )
+        sql = (
+            f"INSERT INTO songs ({', '.join(self.COLUMNS)}) VALUES ({placeholders}) "
+            f"ON CONFLICT(song_id) DO UPDATE SET {updates}, updated_at = CURRENT_TIMESTAMP"
+        )
+
+        written = 0
+        batch = []
+        for song in songs:
+            if song.song_id is None:
+                continue
+            batch.append(tuple(getattr(song, col) for col in self.COLUMNS))
+            if len(batch) >= self.batch_size:
+                written += self._write_batch(sql, batch)
+                batch = []
+        if batch:
+            written += self._write_batch(sql, batch)
+        return written
+
+    def _write_batch(self, sql: str, rows: List[tuple]) -> int:
+        with self._lock, self._conn:
+            self._conn.executemany(sql, rows)
+        return len(rows)
+
+    def get_song(self, song_id: int) -> Optional[Song]:
+        """
+        Fetch a single song by its Genius ID.
+
+        Args:
+            song_id: Genius song ID
+
+        Returns:
+            Song object or None if not stored
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM songs WHERE song_id = ?",
+                (song_id,)
+            ).fetchone()
+        return self._to_song(row) if row else None
+
+    def load_songs(self, section: Optional[str] = None) -> List[Song]:
+        """
+        Load stored songs, ordered by artist and title.
+
+        Args:
+            section: Only load this section (songs stored without one belong
+                to config.DEFAULT_SECTION); None loads every song
+
+        Returns:
+            List of Song objects
+        """
+        sql = f"SELECT {', '.join(self.COLUMNS)} FROM songs"
+        params: tuple = ()
+        if section is not None:
+            sql += " WHERE COALESCE(section, ?) = ?"
+            params = (config.DEFAULT_SECTION, section)
+
+        with self._lock:
+            rows = self._conn.execute(f"{sql} ORDER BY artist, title", params).fetchall()
+        return [self._to_song(row) for row in rows]
+
+    def sections(self) -> List[str]:
+        """
+        List the sections present in the catalog, in alphabetical order.
+
+        Returns:
+            Section names (config.DEFAULT_SECTION for songs without one)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT COALESCE(section, ?) FROM songs ORDER BY 1",
+                (config.DEFAULT_SECTION,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def load_pending_enrichment(self) -> List[Song]:
+        """
+        Load songs whose YouTube lookup was skipped or failed.
+
+        Returns:
+            List of Song objects marked for later enrichment
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM songs WHERE enrichment_pending = 1"
+            ).fetchall()
+        return [self._to_song(row) for row in rows]
+
+    def _to_song(self, row: tuple) -> Song:
+        song = Song(**dict(zip(self.COLUMNS, row)))
+        song.enrichment_pending = bool(song.enrichment_pending)
+        return song
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM songs").fetchone()[0]
+
+    def export(self, filename: str, by_section: bool = False) -> bool:
+        """
+        Write the whole catalog to a spreadsheet or a lyrics archive; the
+        format follows the extension.
+
+        Args:
+            filename: Output filename (.xlsx, .csv or .lyra)
+            by_section: Write one sheet (or CSV file) per section
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if filename.lower().endswith(LyricsArchive.EXTENSION):
+            return FileHandler.save_to_archive(self.load_songs(), filename)
+
+        if by_section:
+            return FileHandler.save_sections(
+                {section: self.load_songs(section) for section in self.sections()}, filename
+            )
+
+        songs = self.load_songs()
+        if filename.lower().endswith('.csv'):
+            return FileHandler.save_to_csv(songs, filename)
+        return FileHandler.save_to_excel(songs, filename)
+
+    def export_section(self, filename: str, section: str) -> bool:
+        """
+        Write one section to its own file (section name appended to the
+        filename), leaving the other sections' files untouched.
+
+        Args:
+            filename: Output filename (.xlsx or .csv)
+            section: Section name
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return FileHandler.save_section(self.load_songs(section), section, filename)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()